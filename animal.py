@@ -1,8 +1,12 @@
 import pygame
-import random
 from settings import *
+from sprite_cache import get_shared_image
+from timer_wheel import TimerWheel
+from random_streams import streams, RandomStream
 
 class Animal(pygame.sprite.Sprite):
+    timers = TimerWheel()  # Feed and product timers of every animal, advanced once per simulation step
+    
     ANIMAL_TYPES = {
         "chicken": {
             "color": (255, 255, 255),
@@ -111,11 +115,10 @@ class Animal(pygame.sprite.Sprite):
         
         self.animal_type = animal_type
         self.data = self.ANIMAL_TYPES[animal_type]
+        self.rng = streams.create("animal")  # This animal's own random numbers, so runs with one seed match
         
-        # Create animal sprite
-        width, height = self.data["size"]
-        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
-        self.create_sprite()
+        # Animal sprite, shared by every animal of this type
+        self.image = get_shared_image(("animal", animal_type), self.create_sprite)
         
         self.rect = self.image.get_rect(center=pos)
         
@@ -126,26 +129,31 @@ class Animal(pygame.sprite.Sprite):
         # Movement behavior
         self.speed = self.data["speed"]
         self.base_speed = self.speed
-        self.direction = pygame.math.Vector2(random.uniform(-1, 1), random.uniform(-1, 1))
+        self.direction = pygame.math.Vector2(self.rng.uniform(-1, 1), self.rng.uniform(-1, 1))
         if self.direction.length() > 0:
             self.direction = self.direction.normalize()
         
         # Behavior timers
         self.change_direction_timer = 0
-        self.change_direction_delay = random.randint(60, 180)
+        self.change_direction_delay = self.rng.randint(60, 180)
         self.pause_timer = 0
-        self.is_paused = random.choice([True, False])
-        self.pause_duration = random.randint(30, 120) if self.is_paused else 0
+        self.is_paused = self.rng.choice([True, False])
+        self.pause_duration = self.rng.randint(30, 120) if self.is_paused else 0
+        
+        self.bounds = pygame.Rect(0, 0, TILE_SIZE * MAP_WIDTH, TILE_SIZE * MAP_HEIGHT)  # Edges of the current map
+        
+        # Set while the animal's scene is current, to steer around obstacles
+        self.pathfinder = None
+        self.route = []  # Path home kept between steps when home is too far for a flow field
         
         # Movement state
         self.wander_radius = self.data["wander_radius"]
-        self.movement_state = random.choice(["wander", "pause", "roam"])
-        self.state_timer = random.randint(120, 300)
+        self.movement_state = self.rng.choice(["wander", "pause", "roam"])
+        self.state_timer = self.rng.randint(120, 300)
         
         # Animal state system
         self.state = "has_product"
-        self.product_timer = 0
-        self.feed_cooldown_timer = 0
+        self.timer_deadline = None  # Tick of Animal.timers when digesting or producing finishes
         self.feed_cooldown_duration = self.data["feed_cooldown"]
         
         # Legacy support
@@ -155,6 +163,7 @@ class Animal(pygame.sprite.Sprite):
         """Create animal visual representation"""
         color = self.data["color"]
         width, height = self.data["size"]
+        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
         
         if self.animal_type == "chicken":
             # Body
@@ -318,126 +327,163 @@ class Animal(pygame.sprite.Sprite):
             # Legs
             pygame.draw.line(self.image, (255, 165, 0), (9, 20), (9, 18), 2)
             pygame.draw.line(self.image, (255, 165, 0), (13, 20), (13, 18), 2)
+            
+        return self.image
     
     def choose_new_direction(self):
         """Choose a new random direction"""
         distance_from_home = self.position.distance_to(self.home_pos)
         
         if distance_from_home > self.wander_radius * 1.5:
-            direction_to_home = self.home_pos - self.position
+            direction_to_home = self.get_route_home() - self.position
             if direction_to_home.length() > 0:
                 self.direction = direction_to_home.normalize()
-                self.direction.x += random.uniform(-0.3, 0.3)
-                self.direction.y += random.uniform(-0.3, 0.3)
+                self.direction.x += self.rng.uniform(-0.3, 0.3)
+                self.direction.y += self.rng.uniform(-0.3, 0.3)
                 if self.direction.length() > 0:
                     self.direction = self.direction.normalize()
         else:
             self.direction = pygame.math.Vector2(
-                random.uniform(-1, 1),
-                random.uniform(-1, 1)
+                self.rng.uniform(-1, 1),
+                self.rng.uniform(-1, 1)
             )
             if self.direction.length() > 0:
                 self.direction = self.direction.normalize()
     
+    def get_route_home(self):
+        """Get the point to head for on the way home - the next tile of the route around obstacles if there is one"""
+        if self.pathfinder:
+            grid_pos = (int(self.position.x) // TILE_SIZE, int(self.position.y) // TILE_SIZE)
+            home = (int(self.home_pos.x) // TILE_SIZE, int(self.home_pos.y) // TILE_SIZE)
+            # Head for the middle of the home area, so animals living near each other share one flow field
+            step = self.pathfinder.get_next_step(grid_pos, self.pathfinder.get_area_goal(home), self.route)
+            if step:
+                return pygame.math.Vector2((step[0] + 0.5) * TILE_SIZE, (step[1] + 0.5) * TILE_SIZE)
+        return self.home_pos
+        
     def change_movement_state(self):
         """Change between different movement behaviors"""
         states = ["wander", "pause", "roam", "wander", "roam"]
-        self.movement_state = random.choice(states)
+        self.movement_state = self.rng.choice(states)
         
         if self.movement_state == "pause":
             self.is_paused = True
-            self.pause_duration = random.randint(30, 120)
+            self.pause_duration = self.rng.randint(30, 120)
             self.pause_timer = 0
             self.speed = 0
         elif self.movement_state == "wander":
             self.is_paused = False
-            self.speed = self.base_speed * random.uniform(0.5, 1.0)
+            self.speed = self.base_speed * self.rng.uniform(0.5, 1.0)
             self.choose_new_direction()
         else:
             self.is_paused = False
-            self.speed = self.base_speed * random.uniform(0.7, 1.3)
+            self.speed = self.base_speed * self.rng.uniform(0.7, 1.3)
             self.choose_new_direction()
         
-        self.state_timer = random.randint(120, 300)
+        self.state_timer = self.rng.randint(120, 300)
                 
     def update(self, dt):
         """Update animal behavior"""
         # State management
-        self.state_timer -= 1
+        self.state_timer -= dt
         if self.state_timer <= 0:
             self.change_movement_state()
         
-        # Animal state machine
-        if self.state == "cooldown":
-            self.feed_cooldown_timer -= 1
-            if self.feed_cooldown_timer <= 0:
-                self.state = "producing"
-                self.product_timer = 0
-                
-        elif self.state == "producing":
-            self.product_timer += dt
-            if self.product_timer >= self.data["product_time"]:
-                self.state = "has_product"
-                self.product_timer = 0
-                self.is_paused = True
-                self.pause_duration = 30
-                self.pause_timer = 0
-        
         # Handle pausing
         if self.is_paused:
-            self.pause_timer += 1
+            self.pause_timer += dt
             if self.pause_timer >= self.pause_duration:
                 self.is_paused = False
-                self.speed = self.base_speed * random.uniform(0.7, 1.2)
+                self.speed = self.base_speed * self.rng.uniform(0.7, 1.2)
                 self.choose_new_direction()
         else:
             # Random movement direction changes
-            self.change_direction_timer += 1
+            self.change_direction_timer += dt
             
             if self.change_direction_timer >= self.change_direction_delay:
                 self.choose_new_direction()
                 self.change_direction_timer = 0
-                self.change_direction_delay = random.randint(60, 180)
+                self.change_direction_delay = self.rng.randint(60, 180)
                 
-                if random.random() < 0.2:
+                if self.rng.random() < 0.2:
                     self.is_paused = True
-                    self.pause_duration = random.randint(20, 60)
+                    self.pause_duration = self.rng.randint(20, 60)
                     self.pause_timer = 0
                     self.speed = 0
             
             # Move using float position
-            self.position.x += self.direction.x * self.speed
-            self.position.y += self.direction.y * self.speed
+            old_position = pygame.math.Vector2(self.position)
+            self.position.x += self.direction.x * self.speed * dt
+            self.position.y += self.direction.y * self.speed * dt
             
+            # Turn back at water, fences, trees, rocks and the edge of the map
+            if self.pathfinder and self.entered_blocked_tile(old_position):
+                self.position = old_position
+                self.choose_new_direction()
+                
             # Update rect position
             self.rect.centerx = int(self.position.x)
             self.rect.centery = int(self.position.y)
             
-            # Keep on screen with bouncing
-            if self.rect.left < 0:
-                self.position.x = self.rect.width // 2
-                self.direction.x = abs(self.direction.x)
-            elif self.rect.right > SCREEN_WIDTH:
-                self.position.x = SCREEN_WIDTH - self.rect.width // 2
-                self.direction.x = -abs(self.direction.x)
+            # The pathfinder already treats cells off the map as blocked - bouncing would fight its routes
+            if not self.pathfinder:
+                self.bounce_off_edges()
+                
+    def bounce_off_edges(self):
+        """Keep on the map with bouncing"""
+        bounds = self.bounds
+        if self.rect.left < bounds.left:
+            self.position.x = bounds.left + self.rect.width // 2
+            self.direction.x = abs(self.direction.x)
+        elif self.rect.right > bounds.right:
+            self.position.x = bounds.right - self.rect.width // 2
+            self.direction.x = -abs(self.direction.x)
+            
+        if self.rect.top < bounds.top:
+            self.position.y = bounds.top + self.rect.height // 2
+            self.direction.y = abs(self.direction.y)
+        elif self.rect.bottom > bounds.bottom:
+            self.position.y = bounds.bottom - self.rect.height // 2
+            self.direction.y = -abs(self.direction.y)
+            
+        if (self.rect.left <= bounds.left or self.rect.right >= bounds.right or 
+            self.rect.top <= bounds.top or self.rect.bottom >= bounds.bottom):
+            if self.rng.random() < 0.5:
+                self.choose_new_direction()
                 
-            if self.rect.top < 0:
-                self.position.y = self.rect.height // 2
-                self.direction.y = abs(self.direction.y)
-            elif self.rect.bottom > SCREEN_HEIGHT:
-                self.position.y = SCREEN_HEIGHT - self.rect.height // 2
-                self.direction.y = -abs(self.direction.y)
+    def entered_blocked_tile(self, old_position):
+        """Whether the last move took the animal into a tile it can't walk on"""
+        grid_pos = (int(self.position.x) // TILE_SIZE, int(self.position.y) // TILE_SIZE)
+        if grid_pos == (int(old_position.x) // TILE_SIZE, int(old_position.y) // TILE_SIZE):
+            return False
+        return not self.pathfinder.is_walkable(grid_pos)
+        
+    def is_idle(self):
+        """Whether the animal is waiting for the player rather than for its timer"""
+        return self.state in ("has_product", "needs_feed")
+        
+    def on_timer(self):
+        """Move on to the next state when digesting or producing finishes"""
+        if self.state == "cooldown":
+            self.state = "producing"
+            self.timers.schedule(self, self.data["product_time"])
             
-            if (self.rect.left <= 0 or self.rect.right >= SCREEN_WIDTH or 
-                self.rect.top <= 0 or self.rect.bottom >= SCREEN_HEIGHT):
-                if random.random() < 0.5:
-                    self.choose_new_direction()
+        elif self.state == "producing":
+            self.state = "has_product"
+            self.is_paused = True
+            self.pause_duration = 30
+            self.pause_timer = 0
             
+    def get_ticks_left(self):
+        """Steps until digesting or producing finishes (0 if neither is under way)"""
+        return self.timers.get_ticks_left(self) or 0
+        
+        
     def feed(self):
         """Feed the animal"""
         if self.state == "needs_feed":
             self.state = "cooldown"
-            self.feed_cooldown_timer = self.feed_cooldown_duration
+            self.timers.schedule(self, self.feed_cooldown_duration)
             self.happiness = min(100, self.happiness + 20)
             self.is_paused = True
             self.pause_duration = 20
@@ -467,24 +513,61 @@ class Animal(pygame.sprite.Sprite):
         elif self.state == "needs_feed":
             return "Hungry - needs feeding"
         elif self.state == "cooldown":
-            time_left = int(self.feed_cooldown_timer / 60)
+            time_left = int(self.get_ticks_left() / 60)
             return f"Digesting... ({time_left}s)"
         elif self.state == "producing":
-            progress = int((self.product_timer / self.data["product_time"]) * 100)
+            product_time = self.data["product_time"]
+            progress = int(((product_time - self.get_ticks_left()) / product_time) * 100)
             return f"Producing... ({progress}%)"
         return ""
         
-    def draw_status(self, surface):
+    def save_data(self):
+        """Return data for saving"""
+        return {
+            "animal_type": self.animal_type,
+            "pos": [self.position.x, self.position.y],
+            "home_pos": [self.home_pos.x, self.home_pos.y],
+            "state": self.state,
+            "product_timer": self.data["product_time"] - self.get_ticks_left() if self.state == "producing" else 0,
+            "feed_cooldown_timer": self.get_ticks_left() if self.state == "cooldown" else 0,
+            "happiness": self.happiness,
+            "rng": self.rng.save_data()
+        }
+        
+    def load_data(self, data):
+        """Load saved data"""
+        self.position = pygame.math.Vector2(data["pos"])
+        self.home_pos = pygame.math.Vector2(data["home_pos"])
+        self.rect.center = (int(self.position.x), int(self.position.y))
+        self.state = data["state"]
+        self.happiness = data["happiness"]
+        if "rng" in data:
+            self.rng = RandomStream.from_data(data["rng"])
+        
+        # Timers carry on from where they were saved
+        if self.state == "cooldown":
+            self.timers.schedule(self, data["feed_cooldown_timer"])
+        elif self.state == "producing":
+            self.timers.schedule(self, self.data["product_time"] - data["product_timer"])
+        else:
+            self.timers.cancel(self)
+            
+    def get_bounds(self):
+        """Get rect covering the sprite and its status indicator"""
+        return self.rect.union(pygame.Rect(self.rect.centerx - 7, self.rect.top - 19, 14, 19))
+        
+    def draw_status(self, surface, offset=(0, 0)):
         """Draw status indicators above animal"""
+        rect = self.rect.move(-offset[0], -offset[1])
         if self.state == "has_product":
             pygame.draw.circle(surface, YELLOW, 
-                             (self.rect.centerx, self.rect.top - 10), 4)
+                             (rect.centerx, rect.top - 10), 4)
             pygame.draw.circle(surface, YELLOW, 
-                             (self.rect.centerx, self.rect.top - 16), 2)
+                             (rect.centerx, rect.top - 16), 2)
                              
         elif self.state == "needs_feed":
-            heart_x = self.rect.centerx
-            heart_y = self.rect.top - 12
+            heart_x = rect.centerx
+            heart_y = rect.top - 12
             pygame.draw.circle(surface, RED, (heart_x - 3, heart_y), 3)
             pygame.draw.circle(surface, RED, (heart_x + 3, heart_y), 3)
             pygame.draw.polygon(surface, RED, [
@@ -494,12 +577,12 @@ class Animal(pygame.sprite.Sprite):
             ])
             
         elif self.state == "cooldown":
-            clock_x = self.rect.centerx
-            clock_y = self.rect.top - 12
+            clock_x = rect.centerx
+            clock_y = rect.top - 12
             pygame.draw.circle(surface, GRAY, (clock_x, clock_y), 4)
             pygame.draw.circle(surface, WHITE, (clock_x, clock_y), 4, 1)
             pygame.draw.line(surface, WHITE, (clock_x, clock_y), (clock_x, clock_y - 3), 1)
             
         elif self.state == "producing":
             pygame.draw.circle(surface, (100, 200, 100), 
-                             (self.rect.centerx, self.rect.top - 10), 3)
\ No newline at end of file
+                             (rect.centerx, rect.top - 10), 3)
\ No newline at end of file
@@ -0,0 +1,64 @@
+import heapq
+from itertools import count
+from settings import *
+
+class AnimalLOD:
+    """Updates animals near the view every step, those further away less often, and lets idle ones sleep"""
+    
+    def __init__(self):
+        self.step = 0
+        self.heap = []  # (due step, sequence, animal) for animals away from the view
+        self.sequence = count()  # Tie-breaker so animals themselves are never compared
+        self.near = set()  # Animals updated every step as of the last update
+        
+    def reset(self, animals):
+        """Start over with a new set of animals - each gets looked at on the next update"""
+        self.heap.clear()
+        self.near.clear()
+        for animal in animals:
+            animal.lod_step = self.step
+            self.schedule(animal, 1)
+            
+    def schedule(self, animal, steps=ANIMAL_FAR_INTERVAL):
+        """Queue an animal that is away from the view, or let it sleep if it is idle"""
+        if animal.is_idle():
+            animal.lod_due = None  # Asleep until it comes back into view
+            return
+            
+        animal.lod_due = self.step + steps
+        heapq.heappush(self.heap, (animal.lod_due, next(self.sequence), animal))
+        
+    def tick(self, animal, dt):
+        """Update an animal for all the steps since it was last updated"""
+        steps = self.step - animal.lod_step
+        animal.lod_step = self.step
+        animal.update(dt * steps)
+        
+    def update(self, index, area, dt):
+        """Update the animals that are due this step and return them"""
+        self.step += 1
+        updated = index.query_rect(area)
+        near = set(updated)
+        
+        for animal in updated:
+            # Sleeping animals wake where they dozed off instead of catching up on the wandering they missed
+            if animal.lod_due is None and animal not in self.near:
+                animal.lod_step = self.step - 1
+            animal.lod_due = None
+            self.tick(animal, dt)
+            
+        # Animals that just left the area carry on at the slower rate
+        for animal in self.near - near:
+            if animal.alive():
+                self.schedule(animal)
+        self.near = near
+        
+        while self.heap and self.heap[0][0] <= self.step:
+            due, _, animal = heapq.heappop(self.heap)
+            # Came into view, was removed or was rescheduled since this entry was queued
+            if animal.lod_due != due or animal in near or not animal.alive():
+                continue
+            self.tick(animal, dt)
+            self.schedule(animal)
+            updated.append(animal)
+        return updated
@@ -0,0 +1,31 @@
+import pygame
+
+class Camera:
+    """The part of the world shown on screen, kept centred on the player"""
+    
+    def __init__(self, world_width, world_height, view_width, view_height):
+        self.world_rect = pygame.Rect(0, 0, world_width, world_height)
+        # Small worlds are shown whole and never scroll
+        self.rect = pygame.Rect(0, 0, min(view_width, world_width), min(view_height, world_height))
+        
+    def set_world_size(self, world_width, world_height):
+        """Move to a different world, keeping the view size - smaller worlds are centred in it"""
+        self.world_rect.size = (world_width, world_height)
+        
+    @property
+    def offset(self):
+        """World position of the top-left corner of the view"""
+        return self.rect.topleft
+        
+    def follow(self, target_rect):
+        """Centre the view on a target without showing anything past the world's edges"""
+        self.rect.center = target_rect.center
+        self.rect.clamp_ip(self.world_rect)
+        
+    def view_to_world(self, view_pos):
+        """Convert a position on the view surface to a world position"""
+        return (view_pos[0] + self.rect.x, view_pos[1] + self.rect.y)
+        
+    def world_rect_to_view(self, rect):
+        """Convert a world-space rect to view-surface space"""
+        return rect.move(-self.rect.x, -self.rect.y)
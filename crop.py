@@ -1,5 +1,6 @@
 import pygame
 from settings import *
+from sprite_cache import get_shared_image
 
 class Crop(pygame.sprite.Sprite):
     # Crop data: growth_time (seconds), sell_price, seed_cost
@@ -21,9 +22,10 @@ class Crop(pygame.sprite.Sprite):
         self.needs_water = False  # Start without needing water for first stage
         self.watered = True  # Consider newly planted crops as watered for initial growth
         self.ready_to_harvest = False
+        self.scheduled_time = None  # Next stage change queued with the world's crop scheduler
         
-        # Create crop images for each stage
-        self.images = self.create_crop_images()
+        # Crop images for each stage, shared by every crop of this type
+        self.images = get_shared_image(("crop", crop_type), self.create_crop_images)
         self.image = self.images[self.stage]
         self.rect = self.image.get_rect(topleft=pos)
         
@@ -96,6 +98,19 @@ class Crop(pygame.sprite.Sprite):
             return True
         return False
         
+    def get_next_stage_time(self):
+        """When the crop will reach its next stage if its watering doesn't change (None once grown)"""
+        if self.stage >= self.max_stage:
+            return None
+            
+        # Mirrors update: unwatered crops past the first stage grow at half speed
+        growth_multiplier = 1.0
+        if not self.watered and self.stage >= 1:
+            growth_multiplier = 0.5
+            
+        growth_per_stage = self.growth_time / self.max_stage
+        return self.time_planted + (self.stage + 1) * growth_per_stage / growth_multiplier
+        
     def update(self, current_time):
         """Update crop growth"""
         # Calculate growth progress
@@ -123,23 +138,64 @@ class Crop(pygame.sprite.Sprite):
         if self.stage >= self.max_stage:
             self.ready_to_harvest = True
             
-    def draw_status(self, surface):
+    def catch_up(self, current_time):
+        """Jump straight to the stage per-frame updates would have reached by current_time"""
+        # At most one step per stage, however long the crop was away
+        next_time = self.get_next_stage_time()
+        while next_time is not None and next_time <= current_time:
+            self.stage += 1
+            if self.stage < self.max_stage:
+                self.needs_water = True
+                self.watered = False
+            next_time = self.get_next_stage_time()
+            
+        if self.stage >= self.max_stage:
+            self.ready_to_harvest = True
+        self.image = self.images[self.stage]
+        
+    def get_bounds(self):
+        """Get rect covering the crop and its status indicator"""
+        return self.rect.union(pygame.Rect(self.rect.centerx - 4, self.rect.top - 10, 8, 10))
+        
+    def draw_status(self, surface, offset=(0, 0)):
         """Draw status indicators above crop"""
+        rect = self.rect.move(-offset[0], -offset[1])
         if self.ready_to_harvest:
             # Draw sparkle when ready to harvest
             import pygame
             from settings import YELLOW
             pygame.draw.circle(surface, YELLOW, 
-                             (self.rect.centerx, self.rect.top - 5), 3)
+                             (rect.centerx, rect.top - 5), 3)
         elif self.needs_water and self.stage > 0:
             # Draw water drop when needs water
             import pygame
             from settings import BLUE
             pygame.draw.circle(surface, BLUE, 
-                             (self.rect.centerx, self.rect.top - 5), 3)
+                             (rect.centerx, rect.top - 5), 3)
             pygame.draw.circle(surface, (150, 200, 255), 
-                             (self.rect.centerx, self.rect.top - 7), 2)
+                             (rect.centerx, rect.top - 7), 2)
             
+    def save_data(self):
+        """Return data for saving"""
+        return {
+            "crop_type": self.crop_type,
+            "pos": self.rect.topleft,
+            "stage": self.stage,
+            "time_planted": self.time_planted,
+            "needs_water": self.needs_water,
+            "watered": self.watered,
+            "ready_to_harvest": self.ready_to_harvest
+        }
+        
+    def load_data(self, data):
+        """Load saved data"""
+        self.stage = data["stage"]
+        self.time_planted = data["time_planted"]
+        self.needs_water = data["needs_water"]
+        self.watered = data["watered"]
+        self.ready_to_harvest = data["ready_to_harvest"]
+        self.image = self.images[self.stage]
+        
     def harvest(self):
         """Harvest the crop and return sell price"""
         if self.ready_to_harvest:
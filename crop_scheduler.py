@@ -0,0 +1,45 @@
+import heapq
+from itertools import count
+
+class CropScheduler:
+    """Priority queue of crops ordered by when they next change stage"""
+    
+    def __init__(self):
+        self.heap = []  # (time, sequence, crop) - stale entries are skipped when popped
+        self.sequence = count()  # Tie-breaker so crops themselves are never compared
+        
+    def __len__(self):
+        return len(self.heap)
+        
+    def schedule(self, crop):
+        """Queue a crop for its next stage change, replacing any earlier entry"""
+        crop.scheduled_time = crop.get_next_stage_time()
+        if crop.scheduled_time is not None:
+            heapq.heappush(self.heap, (crop.scheduled_time, next(self.sequence), crop))
+            
+    def remove(self, crop):
+        """Stop growing a crop - its queued entry is skipped when it comes up"""
+        crop.scheduled_time = None
+        
+    def clear(self):
+        """Forget every scheduled crop"""
+        self.heap.clear()
+        
+    def update(self, current_time):
+        """Grow the crops that are due and return the ones whose stage changed"""
+        # Take everything due first, so a crop rescheduled for now is only looked at once per update
+        due = []
+        while self.heap and self.heap[0][0] <= current_time:
+            scheduled_time, _, crop = heapq.heappop(self.heap)
+            # Harvested, unloaded or rescheduled since this entry was queued
+            if crop.scheduled_time == scheduled_time:
+                due.append(crop)
+                
+        changed = []
+        for crop in due:
+            stage = crop.stage
+            crop.update(current_time)
+            if crop.stage != stage:
+                changed.append(crop)
+            self.schedule(crop)
+        return changed
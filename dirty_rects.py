@@ -0,0 +1,68 @@
+import pygame
+
+class DirtyRectTracker:
+    """Tracks which regions of a surface changed since the last frame"""
+    
+    def __init__(self, max_rects=32):
+        self.previous = {}  # key -> (rect, signature) from last frame
+        self.current = {}  # key -> (rect, signature) seen this frame
+        self.dirty = []  # Rects that need redrawing
+        self.max_rects = max_rects
+        self.full_redraw = True
+        
+    def invalidate(self):
+        """Force the next frame to be fully redrawn"""
+        self.full_redraw = True
+        
+    def mark(self, rect):
+        """Mark a region as dirty"""
+        if rect.width > 0 and rect.height > 0:
+            self.dirty.append(pygame.Rect(rect))
+            
+    def track(self, key, rect, signature):
+        """Register a drawable for this frame, marking it dirty if it changed"""
+        rect = pygame.Rect(rect)
+        self.current[key] = (rect, signature)
+        
+        old = self.previous.get(key)
+        if old is None:
+            self.mark(rect)
+        elif old[1] != signature or old[0] != rect:
+            self.mark(old[0])
+            self.mark(rect)
+            
+    def end_frame(self):
+        """Finish tracking and return merged dirty rects (None = full redraw)"""
+        # Anything that disappeared since last frame leaves a hole to repaint
+        for key, (rect, signature) in self.previous.items():
+            if key not in self.current:
+                self.mark(rect)
+                
+        self.previous = self.current
+        self.current = {}
+        
+        dirty = self.merge(self.dirty)
+        self.dirty = []
+        
+        if self.full_redraw or len(dirty) > self.max_rects:
+            self.full_redraw = False
+            return None
+        return dirty
+        
+    @staticmethod
+    def merge(rects):
+        """Union overlapping rects so each pixel is only redrawn once"""
+        merged = []
+        for rect in rects:
+            rect = pygame.Rect(rect)
+            changed = True
+            while changed:
+                changed = False
+                for other in merged:
+                    if rect.colliderect(other):
+                        merged.remove(other)
+                        rect.union_ip(other)
+                        changed = True
+                        break
+            merged.append(rect)
+        return merged
@@ -0,0 +1,52 @@
+import pygame
+from collections import OrderedDict
+from settings import *
+
+# Fonts shared by every module, keyed by (face, size)
+_fonts = {}
+
+def get_font(size, face=None):
+    """Get a shared font, loading it the first time it is asked for"""
+    key = (face, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(face, size)
+        _fonts[key] = font
+    return font
+
+class TextCache:
+    """Least-recently-used cache of rendered text surfaces"""
+    
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()  # (font, text, antialias, color) -> Surface
+        self.hits = 0
+        self.misses = 0
+        
+    def render(self, font, text, antialias, color):
+        """Render text, reusing the surface from an earlier identical call"""
+        key = (font, text, antialias, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+            
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+        
+    def clear(self):
+        """Drop every cached surface and reset the counters"""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+text_cache = TextCache()
+
+def render_text(font, text, antialias, color):
+    """Render text through the shared cache - the result must not be modified"""
+    return text_cache.render(font, text, antialias, color)
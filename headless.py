@@ -0,0 +1,50 @@
+import os
+import sys
+import time
+
+# No window and no sound - must be set before pygame starts up
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from settings import *
+from main import FarmGame
+
+class SimulatedClock:
+    """Stands in for time.time, moving on one simulation step per tick however fast the ticks really run"""
+    
+    def __init__(self, start):
+        self.now = start
+        
+    def __call__(self):
+        return self.now
+        
+    def tick(self):
+        """Move on one simulation step"""
+        self.now += SIM_STEP
+
+def run_headless(ticks, seed=WORLD_SEED):
+    """Run the game's simulation for a number of fixed steps as fast as possible, drawing nothing
+    
+    Returns the game and the steps run per second - profile with python -m cProfile headless.py TICKS.
+    The game's worlds keep the simulated clock (game.scenes.world_clock), so crops only grow on
+    after the run if the caller goes on ticking it.
+    """
+    clock = SimulatedClock(time.time())
+    game = FarmGame(seed, clock)  # Crops grow by simulated time, not by how long the run took
+    start = time.perf_counter()
+    for _ in range(ticks):
+        clock.tick()
+        game.update(1)
+    elapsed = time.perf_counter() - start
+    return game, ticks / elapsed if elapsed else float("inf")
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("usage: python headless.py TICKS [SEED]")
+        sys.exit(1)
+    ticks = int(sys.argv[1])
+    seed = int(sys.argv[2]) if len(sys.argv) == 3 else WORLD_SEED
+    game, rate = run_headless(ticks, seed)
+    print(f"{ticks} ticks at {rate:.0f} ticks/s ({ticks * SIM_STEP:.0f} s of game time) - "
+          f"day {game.time_system.day} {game.time_system.get_time_string()}, {game.time_system.season}, "
+          f"{len(game.animals)} animals, {len(game.world.crops)} crops")
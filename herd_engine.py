@@ -0,0 +1,288 @@
+import pygame
+from animal import Animal
+from random_streams import streams
+from settings import *
+
+try:
+    import numpy as np
+except ImportError:  # Optional - without it animals update one by one
+    np = None
+
+STATES = ["has_product", "needs_feed", "cooldown", "producing"]
+HAS_PRODUCT, NEEDS_FEED, COOLDOWN, PRODUCING = range(len(STATES))
+MOVEMENT_STATES = ["wander", "pause", "roam"]
+WANDER, PAUSE, ROAM = range(len(MOVEMENT_STATES))
+
+# One array per field, one entry per animal
+FIELDS = {
+    "pos_x": float, "pos_y": float, "home_x": float, "home_y": float,
+    "dir_x": float, "dir_y": float, "speed": float, "base_speed": float,
+    "wander_radius": float,
+    "center_x": int, "center_y": int, "width": int, "height": int,
+    # Timers count in steps, which a variable dt makes fractional
+    "change_direction_timer": float, "change_direction_delay": float,
+    "pause_timer": float, "pause_duration": float, "state_timer": float,
+    "is_paused": bool, "movement_state": int, "state": int,
+}
+
+def herd_field(name, convert):
+    """Property reading and writing one animal's entry of a herd array"""
+    def get(self):
+        return convert(self.herd.arrays[name][self.herd_index])
+        
+    def set(self, value):
+        self.herd.arrays[name][self.herd_index] = value
+        
+    return property(get, set)
+
+def herd_vector(x_name, y_name):
+    """Property for a Vector2 stored in two herd arrays - the vector handed out is a copy"""
+    def get(self):
+        arrays = self.herd.arrays
+        return pygame.math.Vector2(arrays[x_name][self.herd_index], arrays[y_name][self.herd_index])
+        
+    def set(self, value):
+        self.herd.arrays[x_name][self.herd_index] = value[0]
+        self.herd.arrays[y_name][self.herd_index] = value[1]
+        
+    return property(get, set)
+
+def herd_choice(name, choices):
+    """Property for a string state stored as its index in a herd array"""
+    def get(self):
+        return choices[self.herd.arrays[name][self.herd_index]]
+        
+    def set(self, value):
+        self.herd.arrays[name][self.herd_index] = choices.index(value)
+        
+    return property(get, set)
+
+class HerdAnimal(Animal):
+    """An animal whose state lives in its herd's arrays - a thin view for drawing and interaction"""
+    
+    position = herd_vector("pos_x", "pos_y")
+    home_pos = herd_vector("home_x", "home_y")
+    direction = herd_vector("dir_x", "dir_y")
+    speed = herd_field("speed", float)
+    base_speed = herd_field("base_speed", float)
+    wander_radius = herd_field("wander_radius", float)
+    change_direction_timer = herd_field("change_direction_timer", float)
+    change_direction_delay = herd_field("change_direction_delay", float)
+    pause_timer = herd_field("pause_timer", float)
+    pause_duration = herd_field("pause_duration", float)
+    state_timer = herd_field("state_timer", float)
+    is_paused = herd_field("is_paused", bool)
+    movement_state = herd_choice("movement_state", MOVEMENT_STATES)
+    state = herd_choice("state", STATES)
+    
+    # Copied from the animal being adopted into the herd
+    COPIED = ["position", "home_pos", "direction", "speed", "base_speed", "wander_radius",
+              "change_direction_timer", "change_direction_delay", "pause_timer", "pause_duration",
+              "state_timer", "is_paused", "movement_state", "state"]
+              
+    def __init__(self, herd, animal):
+        pygame.sprite.Sprite.__init__(self)
+        self.herd = herd
+        self.herd_index = herd.allocate(self)
+        self.rect_generation = None
+        
+        self.animal_type = animal.animal_type
+        self.data = animal.data
+        self.image = animal.image
+        self.feed_cooldown_duration = animal.feed_cooldown_duration
+        self.happiness = animal.happiness
+        self.rng = animal.rng
+        for name in self.COPIED:
+            setattr(self, name, getattr(animal, name))
+        self.rect = animal.rect
+        
+        # The view takes over the animal's place on the timer wheel
+        self.timer_deadline = None
+        if animal.timer_deadline is not None:
+            self.timers.schedule_at(self, animal.timer_deadline)
+            self.timers.cancel(animal)
+        
+    @property
+    def rect(self):
+        """The sprite's rect, refreshed from the herd after each batch update"""
+        herd = self.herd
+        if self.rect_generation != herd.generation:
+            self.cached_rect.center = (int(herd.arrays["center_x"][self.herd_index]),
+                                       int(herd.arrays["center_y"][self.herd_index]))
+            self.rect_generation = herd.generation
+        return self.cached_rect
+        
+    @rect.setter
+    def rect(self, rect):
+        self.cached_rect = pygame.Rect(rect)
+        arrays = self.herd.arrays
+        arrays["width"][self.herd_index], arrays["height"][self.herd_index] = self.cached_rect.size
+        arrays["center_x"][self.herd_index], arrays["center_y"][self.herd_index] = self.cached_rect.center
+        self.rect_generation = self.herd.generation
+        
+    def update(self, dt):
+        """Herd animals are moved by Herd.update, all at once"""
+        
+    def load_data(self, data):
+        """Load saved data"""
+        super().load_data(data)
+        self.rect = self.cached_rect  # Write the new centre back to the herd
+
+class Herd(pygame.sprite.Group):
+    """Sprite group that keeps its animals' state in NumPy arrays and updates them in one batch"""
+    
+    available = np is not None
+    
+    def __init__(self, *sprites, capacity=256):
+        if np is None:
+            raise ImportError("Herd needs numpy")
+        self.members = []  # HerdAnimal for each array row
+        self.arrays = {name: np.zeros(capacity, dtype=dtype) for name, dtype in FIELDS.items()}
+        self.generation = 0  # Bumped by every update so views know to refresh their rects
+        self.bounds = pygame.Rect(0, 0, TILE_SIZE * MAP_WIDTH, TILE_SIZE * MAP_HEIGHT)  # Edges of the current map
+        # Seeded from the world seed, drawing whole batches at a time
+        self.rng = np.random.default_rng(streams.create("herd").seed)
+        super().__init__(*sprites)
+        
+    def save_data(self):
+        """Return data for saving - where the herd's generator has got to"""
+        return {"rng": self.rng.bit_generator.state}
+        
+    def load_data(self, data):
+        """Load saved data, continuing the saved generator"""
+        self.rng.bit_generator.state = data["rng"]
+        
+    def allocate(self, animal):
+        """Claim an array row for a new member"""
+        if len(self.members) == len(self.arrays["pos_x"]):
+            for name, array in self.arrays.items():
+                grown = np.zeros(len(array) * 2, dtype=array.dtype)
+                grown[:len(array)] = array
+                self.arrays[name] = grown
+        self.members.append(animal)
+        return len(self.members) - 1
+        
+    def add(self, *sprites):
+        """Add animals, adopting plain Animals into the herd's arrays"""
+        super().add(*[sprite if isinstance(sprite, HerdAnimal) and sprite.herd is self else HerdAnimal(self, sprite)
+                      for sprite in sprites])
+                      
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        # Move the last row into the freed one
+        index = sprite.herd_index
+        last = len(self.members) - 1
+        if index != last:
+            moved = self.members[index] = self.members[last]
+            moved.herd_index = index
+            for array in self.arrays.values():
+                array[index] = array[last]
+        self.members.pop()
+        sprite.herd_index = None
+        sprite.timers.cancel(sprite)  # Its state went with the row
+        
+    def choose_new_direction(self, rows):
+        """Batch Animal.choose_new_direction - head home when strayed too far, otherwise anywhere"""
+        if not len(rows):
+            return
+        a = self.arrays
+        to_home_x = a["home_x"][rows] - a["pos_x"][rows]
+        to_home_y = a["home_y"][rows] - a["pos_y"][rows]
+        distance = np.hypot(to_home_x, to_home_y)
+        far = distance > a["wander_radius"][rows] * 1.5
+        distance[distance == 0] = 1
+        
+        x = np.where(far, to_home_x / distance + self.rng.uniform(-0.3, 0.3, len(rows)), self.rng.uniform(-1, 1, len(rows)))
+        y = np.where(far, to_home_y / distance + self.rng.uniform(-0.3, 0.3, len(rows)), self.rng.uniform(-1, 1, len(rows)))
+        length = np.hypot(x, y)
+        length[length == 0] = 1
+        a["dir_x"][rows] = x / length
+        a["dir_y"][rows] = y / length
+        
+    def change_movement_state(self, rows):
+        """Batch Animal.change_movement_state"""
+        a = self.arrays
+        movement_state = np.array([WANDER, PAUSE, ROAM, WANDER, ROAM])[self.rng.integers(0, 5, len(rows))]
+        a["movement_state"][rows] = movement_state
+        
+        pausing = rows[movement_state == PAUSE]
+        a["is_paused"][pausing] = True
+        a["pause_duration"][pausing] = self.rng.integers(30, 121, len(pausing))
+        a["pause_timer"][pausing] = 0
+        a["speed"][pausing] = 0
+        
+        for state, low, high in ((WANDER, 0.5, 1.0), (ROAM, 0.7, 1.3)):
+            going = rows[movement_state == state]
+            a["is_paused"][going] = False
+            a["speed"][going] = a["base_speed"][going] * self.rng.uniform(low, high, len(going))
+            self.choose_new_direction(going)
+            
+        a["state_timer"][rows] = self.rng.integers(120, 301, len(rows))
+        
+    def update(self, dt, cell_size=SPATIAL_CELL_SIZE):
+        """Run Animal.update for every member at once - returns the animals that moved into another cell"""
+        count = len(self.members)
+        if not count:
+            return []
+        a = {name: array[:count] for name, array in self.arrays.items()}
+        old_cell_x = a["center_x"] // cell_size
+        old_cell_y = a["center_y"] // cell_size
+        self.generation += 1
+        
+        # Movement state changes
+        a["state_timer"] -= dt
+        self.change_movement_state(np.flatnonzero(a["state_timer"] <= 0))
+        
+        # Handle pausing
+        paused = np.flatnonzero(a["is_paused"])
+        moving = np.flatnonzero(~a["is_paused"])
+        a["pause_timer"][paused] += dt
+        resuming = paused[a["pause_timer"][paused] >= a["pause_duration"][paused]]
+        a["is_paused"][resuming] = False
+        a["speed"][resuming] = a["base_speed"][resuming] * self.rng.uniform(0.7, 1.2, len(resuming))
+        self.choose_new_direction(resuming)
+        
+        # Random movement direction changes
+        a["change_direction_timer"][moving] += dt
+        turning = moving[a["change_direction_timer"][moving] >= a["change_direction_delay"][moving]]
+        self.choose_new_direction(turning)
+        a["change_direction_timer"][turning] = 0
+        a["change_direction_delay"][turning] = self.rng.integers(60, 181, len(turning))
+        stopping = turning[self.rng.random(len(turning)) < 0.2]
+        a["is_paused"][stopping] = True
+        a["pause_duration"][stopping] = self.rng.integers(20, 61, len(stopping))
+        a["pause_timer"][stopping] = 0
+        a["speed"][stopping] = 0
+        
+        # Move using float position
+        a["pos_x"][moving] += a["dir_x"][moving] * a["speed"][moving] * dt
+        a["pos_y"][moving] += a["dir_y"][moving] * a["speed"][moving] * dt
+        a["center_x"][moving] = a["pos_x"][moving].astype(int)
+        a["center_y"][moving] = a["pos_y"][moving].astype(int)
+        
+        # Keep on the map with bouncing
+        bounds = self.bounds
+        half_width = a["width"][moving] // 2
+        half_height = a["height"][moving] // 2
+        left = a["center_x"][moving] - half_width
+        right = left + a["width"][moving]
+        top = a["center_y"][moving] - half_height
+        bottom = top + a["height"][moving]
+        for low, high, pos, direction, half, start, limit in (
+                (left, right, "pos_x", "dir_x", half_width, bounds.left, bounds.right),
+                (top, bottom, "pos_y", "dir_y", half_height, bounds.top, bounds.bottom)):
+            before = low < start
+            past = ~before & (high > limit)
+            a[pos][moving[before]] = start + half[before]
+            a[direction][moving[before]] = np.abs(a[direction][moving[before]])
+            a[pos][moving[past]] = limit - half[past]
+            a[direction][moving[past]] = -np.abs(a[direction][moving[past]])
+        a["center_x"][moving] = a["pos_x"][moving].astype(int)
+        a["center_y"][moving] = a["pos_y"][moving].astype(int)
+        
+        at_edge = moving[(left <= bounds.left) | (right >= bounds.right) | (top <= bounds.top) | (bottom >= bounds.bottom)]
+        self.choose_new_direction(at_edge[self.rng.random(len(at_edge)) < 0.5])
+        
+        # Only animals that crossed a cell boundary need re-filing in a spatial index
+        crossed = np.flatnonzero((a["center_x"] // cell_size != old_cell_x) | (a["center_y"] // cell_size != old_cell_y))
+        return [self.members[index] for index in crossed.tolist()]
@@ -1,8 +1,20 @@
 import pygame
+import os
 from settings import *
+from fonts import get_font, render_text
 from crop import Crop
 
 class Inventory:
+    # Items pre-rendered into the icon atlas, in atlas order
+    ATLAS_ITEMS = [
+        "wheat_seed", "carrot_seed", "tomato_seed", "corn_seed",
+        "wheat", "carrot", "tomato", "corn",
+        "wood", "stone",
+        "egg", "milk", "wool", "truffle", "cheese", "duck_egg",
+        "rabbit_foot", "horseshoe", "llama_wool", "turkey_feather",
+        "fence", "scarecrow", "chest",
+    ]
+    
     def __init__(self):
         # Main inventory storage (36 slots)
         self.items = {
@@ -27,9 +39,9 @@ class Inventory:
         self.selected_inventory_item = None
         
         # Fonts
-        self.font = pygame.font.Font(None, 20)
-        self.title_font = pygame.font.Font(None, 28)
-        self.small_font = pygame.font.Font(None, 16)
+        self.font = get_font(20)
+        self.title_font = get_font(28)
+        self.small_font = get_font(16)
         
         # Item categories for display
         self.item_categories = {
@@ -40,6 +52,11 @@ class Inventory:
             "Crafted": ["fence", "scarecrow", "chest"]
         }
         
+        # Item icons - rasterised once, then drawn with a single blit
+        self.icon_atlas = None
+        self.item_icons = {}
+        self.build_icon_atlas()
+        
     def add_item(self, item, amount=1):
         """Add item to inventory"""
         if item in self.items:
@@ -177,6 +194,20 @@ class Inventory:
                 return True
         
         return False
+        
+    def get_hotbar_rect(self, screen_width, screen_height):
+        """Get the rect covering the hotbar"""
+        slot_size = 64
+        spacing = 8
+        total_width = (slot_size * 5) + (spacing * 4)
+        start_x = (screen_width - total_width) // 2
+        start_y = screen_height - slot_size - 20
+        return pygame.Rect(start_x, start_y, total_width, slot_size)
+        
+    def get_hotbar_signature(self):
+        """Get the values shown in the hotbar, to detect when it changes"""
+        counts = tuple(self.items.get(item_name, 0) if item_name else None for item_name in self.hotbar)
+        return (tuple(self.hotbar), counts, self.selected_hotbar_slot)
     
     def draw_hotbar(self, surface, screen_width, screen_height):
         """Draw the hotbar at bottom center of screen"""
@@ -202,7 +233,7 @@ class Inventory:
                 
                 self.draw_item_icon(surface, item_name, x + slot_size // 2, y + 20)
                 
-                count_text = self.font.render(str(count), True, WHITE)
+                count_text = render_text(self.font, str(count), True, WHITE)
                 text_bg = pygame.Surface((count_text.get_width() + 4, count_text.get_height() + 2))
                 text_bg.fill((0, 0, 0))
                 text_bg.set_alpha(180)
@@ -212,11 +243,11 @@ class Inventory:
                 display_name = item_name.replace("_", " ").replace(" seed", "").title()
                 if len(display_name) > 8:
                     display_name = display_name[:7] + "."
-                name_text = self.small_font.render(display_name, True, WHITE)
+                name_text = render_text(self.small_font, display_name, True, WHITE)
                 name_x = x + slot_size // 2 - name_text.get_width() // 2
                 surface.blit(name_text, (name_x, y + 40))
             
-            num_text = self.small_font.render(str(i + 1), True, YELLOW if is_selected else GRAY)
+            num_text = render_text(self.small_font, str(i + 1), True, YELLOW if is_selected else GRAY)
             surface.blit(num_text, (x + 4, y + 4))
     
     def draw_integrated_hotbar(self, surface, panel_x, panel_y, panel_width, panel_height):
@@ -227,7 +258,7 @@ class Inventory:
         start_x = panel_x + (panel_width - total_width) // 2
         start_y = panel_y + panel_height - slot_size - 30
         
-        hotbar_label = self.font.render("Hotbar", True, YELLOW)
+        hotbar_label = render_text(self.font, "Hotbar", True, YELLOW)
         label_x = panel_x + (panel_width - hotbar_label.get_width()) // 2
         surface.blit(hotbar_label, (label_x, start_y - 25))
         
@@ -247,7 +278,7 @@ class Inventory:
                 
                 self.draw_item_icon(surface, item_name, x + slot_size // 2, y + 20)
                 
-                count_text = self.font.render(str(count), True, WHITE)
+                count_text = render_text(self.font, str(count), True, WHITE)
                 text_bg = pygame.Surface((count_text.get_width() + 4, count_text.get_height() + 2))
                 text_bg.fill((0, 0, 0))
                 text_bg.set_alpha(180)
@@ -257,11 +288,11 @@ class Inventory:
                 display_name = item_name.replace("_", " ").replace(" seed", "").title()
                 if len(display_name) > 8:
                     display_name = display_name[:7] + "."
-                name_text = self.small_font.render(display_name, True, WHITE)
+                name_text = render_text(self.small_font, display_name, True, WHITE)
                 name_x = x + slot_size // 2 - name_text.get_width() // 2
                 surface.blit(name_text, (name_x, y + 40))
             
-            num_text = self.small_font.render(str(i + 1), True, YELLOW if is_selected else GRAY)
+            num_text = render_text(self.small_font, str(i + 1), True, YELLOW if is_selected else GRAY)
             surface.blit(num_text, (x + 4, y + 4))
     
     def draw_full_inventory(self, surface, screen_width, screen_height):
@@ -288,19 +319,19 @@ class Inventory:
         
         pygame.draw.rect(surface, WHITE, (panel_x, panel_y, panel_width, panel_height), 3)
         
-        title = self.title_font.render("Inventory", True, WHITE)
+        title = render_text(self.title_font, "Inventory", True, WHITE)
         surface.blit(title, (panel_x + 20, panel_y + 15))
         
-        close_text = self.font.render("Press E to close", True, GRAY)
+        close_text = render_text(self.font, "Press E to close", True, GRAY)
         surface.blit(close_text, (panel_x + panel_width - 150, panel_y + 15))
         
         if self.selected_inventory_item:
-            instruction = self.small_font.render(
+            instruction = render_text(self.small_font,
                 f"Selected: {self.selected_inventory_item.replace('_', ' ').title()} - Click hotbar slot to assign",
                 True, YELLOW
             )
         else:
-            instruction = self.small_font.render(
+            instruction = render_text(self.small_font,
                 "Click item to select, then click hotbar slot to assign",
                 True, GRAY
             )
@@ -337,7 +368,7 @@ class Inventory:
                 if count > 0:
                     self.draw_item_icon(surface, item_name, x + slot_size // 2, y + 15)
                     
-                    count_text = self.font.render(str(count), True, WHITE)
+                    count_text = render_text(self.font, str(count), True, WHITE)
                     text_bg = pygame.Surface((count_text.get_width() + 4, count_text.get_height() + 2))
                     text_bg.fill((0, 0, 0))
                     text_bg.set_alpha(180)
@@ -347,19 +378,19 @@ class Inventory:
                     display_name = item_name.replace("_", " ").title()
                     if len(display_name) > 9:
                         display_name = display_name[:8] + "."
-                    name_text = self.small_font.render(display_name, True, WHITE)
+                    name_text = render_text(self.small_font, display_name, True, WHITE)
                     name_x = x + slot_size // 2 - name_text.get_width() // 2
                     surface.blit(name_text, (name_x, y + 45))
                 else:
                     display_name = item_name.replace("_", " ").title()
                     if len(display_name) > 9:
                         display_name = display_name[:8] + "."
-                    name_text = self.small_font.render(display_name, True, (100, 100, 100))
+                    name_text = render_text(self.small_font, display_name, True, (100, 100, 100))
                     name_x = x + slot_size // 2 - name_text.get_width() // 2
                     name_y = y + slot_size // 2 - name_text.get_height() // 2
                     surface.blit(name_text, (name_x, name_y))
                     
-                    count_text = self.small_font.render("0", True, (100, 100, 100))
+                    count_text = render_text(self.small_font, "0", True, (100, 100, 100))
                     surface.blit(count_text, (x + 5, y + slot_size - 20))
                 
                 slot_index += 1
@@ -369,7 +400,51 @@ class Inventory:
         
         self.draw_integrated_hotbar(surface, panel_x, panel_y, panel_width, panel_height)
     
+    def build_icon_atlas(self):
+        """Rasterise every known item icon into one atlas surface, or load it from the disk cache"""
+        atlas_size = (ICON_SIZE * len(self.ATLAS_ITEMS), ICON_SIZE)
+        atlas = None
+        if ICON_CACHE_FILE and os.path.exists(ICON_CACHE_FILE):
+            try:
+                atlas = pygame.image.load(ICON_CACHE_FILE)
+            except Exception as e:
+                print(f"Error loading icon cache: {e}")
+            # A cache written for a different item list is stale
+            if atlas and atlas.get_size() != atlas_size:
+                atlas = None
+                
+        if atlas is None:
+            atlas = pygame.Surface(atlas_size, pygame.SRCALPHA)
+            for i, item_name in enumerate(self.ATLAS_ITEMS):
+                atlas.set_clip((i * ICON_SIZE, 0, ICON_SIZE, ICON_SIZE))
+                self.paint_item_icon(atlas, item_name, i * ICON_SIZE + ICON_SIZE // 2, ICON_SIZE // 2)
+            atlas.set_clip(None)
+            
+            if ICON_CACHE_FILE:
+                try:
+                    pygame.image.save(atlas, ICON_CACHE_FILE)
+                except Exception as e:
+                    print(f"Error saving icon cache: {e}")
+                    
+        self.icon_atlas = atlas
+        for i, item_name in enumerate(self.ATLAS_ITEMS):
+            self.item_icons[item_name] = atlas.subsurface((i * ICON_SIZE, 0, ICON_SIZE, ICON_SIZE))
+            
+    def get_item_icon(self, item_name):
+        """Get the pre-rendered icon for an item"""
+        icon = self.item_icons.get(item_name)
+        if icon is None:
+            # Items outside the atlas are rasterised on first use
+            icon = pygame.Surface((ICON_SIZE, ICON_SIZE), pygame.SRCALPHA)
+            self.paint_item_icon(icon, item_name, ICON_SIZE // 2, ICON_SIZE // 2)
+            self.item_icons[item_name] = icon
+        return icon
+        
     def draw_item_icon(self, surface, item_name, x, y):
+        """Draw the icon for an item centered on (x, y)"""
+        surface.blit(self.get_item_icon(item_name), (x - ICON_SIZE // 2, y - ICON_SIZE // 2))
+        
+    def paint_item_icon(self, surface, item_name, x, y):
         """Draw detailed icon for an item"""
         
         # Seeds
@@ -1,20 +1,29 @@
 import pygame
 import sys
 import json
+import time
 from settings import *
 from player import Player
 from inventory import Inventory
 # from crafting import Crafting
-from world import World
+from scene_manager import SceneManager, create_scenes
+from spatial_hash import SpatialHash
+from herd_engine import Herd
+from animal_lod import AnimalLOD
 from animal import Animal
+from random_streams import streams
 from npc import NPC
 from time_system import TimeSystem
 from ui import UI
 from plot_system import PlotSystem
 from quest_system import QuestSystem
+from dirty_rects import DirtyRectTracker
+from viewport import Viewport
+from camera import Camera
+from fonts import get_font, render_text
 
 class FarmGame:
-    def __init__(self):
+    def __init__(self, seed=WORLD_SEED, world_clock=time.time):
         pygame.init()
         self.screen = pygame.display.set_mode((DEFAULT_SCREEN_WIDTH, DEFAULT_SCREEN_HEIGHT), 
                                               pygame.RESIZABLE)
@@ -25,18 +34,26 @@ class FarmGame:
         self.screen_width = DEFAULT_SCREEN_WIDTH
         self.screen_height = DEFAULT_SCREEN_HEIGHT
         
-        # Create world surface (fixed size for game world)
+        # Game world, and the camera's window onto it
         self.world_width = TILE_SIZE * MAP_WIDTH
         self.world_height = TILE_SIZE * MAP_HEIGHT
-        self.world_surface = pygame.Surface((self.world_width, self.world_height))
+        self.camera = Camera(self.world_width, self.world_height, TILE_SIZE * VIEW_WIDTH, TILE_SIZE * VIEW_HEIGHT)
+        
+        # World surface (holds only what the camera sees, scaled to fit the window)
+        self.world_surface = pygame.Surface(self.camera.rect.size)
+        self.viewport = Viewport(self.camera.rect.width, self.camera.rect.height, self.screen_width, self.screen_height)
         
         # Game objects
         self.player = Player((self.world_width // 2, self.world_height // 2))
-        self.world = World()
-        self.world.create_default_map()
+        self.camera.follow(self.player.rect)
+        
+        # Scenes - the farm and the buildings the player can walk into
+        self.scenes = SceneManager(create_scenes(), self.camera.rect.size, world_clock)
+        self.scene, self.world = self.scenes.switch(FARM_SCENE)
         
         # Animals - NOW WITH MORE VARIETY!
-        self.animals = pygame.sprite.Group()
+        streams.reset(seed)  # Before anything draws from a stream
+        self.animals = self.create_animal_group()
         # Original animals
         self.animals.add(Animal((300, 300), "chicken"))
         self.animals.add(Animal((350, 320), "chicken"))
@@ -53,6 +70,15 @@ class FarmGame:
         self.mayor = NPC((self.world_width - 100, 150), "mayor")
         self.npcs.add(self.shopkeeper, self.mayor)
         
+        # Animals and NPCs of each scene, swapped in when the player enters it
+        self.scene_sprites = {FARM_SCENE: (self.animals, self.npcs)}
+        
+        # Where the current scene's animals and NPCs are, for proximity and culling queries
+        self.animal_index = SpatialHash()
+        self.npc_index = SpatialHash()
+        self.animal_lod = AnimalLOD()  # How often each animal is updated, by distance from the view
+        self.index_entities()
+        
         # Show welcome message
         self.show_notification("Welcome! Press F near Shopkeeper to trade!")
         self.notification_timer = 300
@@ -86,11 +112,23 @@ class FarmGame:
         self.prompt_fade_duration = 120  # 2 seconds at 60 FPS to fully fade
         self.prompt_shown = False  # Track if prompt was already shown
         
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(24)
+        self.prompt_font = get_font(18)
         
         # Settings button rect
         self.settings_button_rect = None
         
+        # Dirty-rect rendering - world regions and screen UI tracked separately
+        self.world_dirty = DirtyRectTracker()
+        self.screen_dirty = DirtyRectTracker()
+        self.world_state = None  # Plots, darkness and grid - any change redraws everything
+        
+        # Where moving sprites were before the last simulation step, for drawing between steps
+        self.previous_positions = {}
+        
+        # Night tint, filled once and reused - only its alpha changes between frames
+        self.darkness_overlay = None
+        
     def handle_resize(self, width, height):
         """Handle window resize event"""
         self.screen_width = max(MIN_SCREEN_WIDTH, width)
@@ -99,44 +137,19 @@ class FarmGame:
                                               pygame.RESIZABLE)
         # Update global settings
         update_screen_size(self.screen_width, self.screen_height)
+        self.viewport.resize(self.screen_width, self.screen_height)
+        
+        # The whole window has to be repainted after a resize
+        self.world_dirty.invalidate()
+        self.screen_dirty.invalidate()
         
     def screen_to_world_pos(self, screen_pos):
         """Convert screen position to world position"""
-        # Calculate scale to fit world in window
-        scale_x = self.screen_width / self.world_width
-        scale_y = self.screen_height / self.world_height
-        scale = min(scale_x, scale_y)
-        
-        # Calculate scaled dimensions and offset
-        scaled_width = int(self.world_width * scale)
-        scaled_height = int(self.world_height * scale)
-        offset_x = (self.screen_width - scaled_width) // 2
-        offset_y = (self.screen_height - scaled_height) // 2
-        
-        # Adjust for world offset
-        adjusted_x = screen_pos[0] - offset_x
-        adjusted_y = screen_pos[1] - offset_y
-        
-        # Scale to world coordinates
-        world_x = adjusted_x / scale
-        world_y = adjusted_y / scale
-        
-        return (int(world_x), int(world_y))
+        return self.camera.view_to_world(self.viewport.screen_to_world(screen_pos))
     
     def is_click_in_world(self, screen_pos):
         """Check if a screen position is within the world area"""
-        scale_x = self.screen_width / self.world_width
-        scale_y = self.screen_height / self.world_height
-        scale = min(scale_x, scale_y)
-        
-        scaled_width = int(self.world_width * scale)
-        scaled_height = int(self.world_height * scale)
-        offset_x = (self.screen_width - scaled_width) // 2
-        offset_y = (self.screen_height - scaled_height) // 2
-        
-        x, y = screen_pos
-        return (offset_x <= x < offset_x + scaled_width and
-                offset_y <= y < offset_y + scaled_height)
+        return self.viewport.contains(screen_pos)
         
     def handle_events(self):
         """Handle all game events"""
@@ -166,7 +179,7 @@ class FarmGame:
                         grid_y = world_pos[1] // TILE_SIZE
                         grid_pos = (grid_x, grid_y)
                         
-                        if self.plot_system.is_claimed(grid_pos):
+                        if self.scene.plots and self.plot_system.is_claimed(grid_pos):
                             success, message = self.plot_system.toggle_lock(grid_pos)
                             if message:
                                 self.show_notification(message)
@@ -276,7 +289,7 @@ class FarmGame:
                 elif event.button == 3:
                     if self.shopkeeper.shop_mode:
                         self.shopkeeper.shop_mode = None
-                    elif self.is_click_in_world(mouse_pos):
+                    elif self.scene.plots and self.is_click_in_world(mouse_pos):
                         world_pos = self.screen_to_world_pos(mouse_pos)
                         grid_x = world_pos[0] // TILE_SIZE
                         grid_y = world_pos[1] // TILE_SIZE
@@ -300,28 +313,46 @@ class FarmGame:
                                         self.last_completed_quest = completed
                                         self.quest_notification_timer = 180
     
-    def check_nearby_entities(self):
-        """Check for nearby NPCs and animals for F key interaction"""
-        player_pos = pygame.math.Vector2(self.player.rect.center)
+    def create_animal_group(self):
+        """Make an empty group for a scene's animals - a batched Herd when that is enabled"""
+        if VECTORIZED_ANIMALS and Herd.available:
+            return Herd()
+        return pygame.sprite.Group()
+        
+    def update_animals(self, dt):
+        """Move the scene's animals and keep their spatial index up to date"""
+        if isinstance(self.animals, Herd):
+            # One batch for the whole herd - only animals that crossed into another cell need re-filing
+            for animal in self.animals.update(dt, self.animal_index.cell_size):
+                self.animal_index.move(animal)
+            return
+            
+        area = self.camera.rect.inflate(ANIMAL_LOD_MARGIN * 2, ANIMAL_LOD_MARGIN * 2)
+        for animal in self.animal_lod.update(self.animal_index, area, dt):
+            self.animal_index.move(animal)
+            
+    def index_entities(self):
+        """Rebuild the spatial indexes after the scene's animals or NPCs were replaced"""
+        self.animal_index.rebuild(self.animals)
+        self.animal_lod.reset(self.animals)
+        
+        # Animals wander the whole map, not just the first screenful of it
+        bounds = pygame.Rect(0, 0, self.world.width * TILE_SIZE, self.world.height * TILE_SIZE)
+        if isinstance(self.animals, Herd):
+            self.animals.bounds = bounds
+        for animal in self.animals:
+            animal.pathfinder = self.world.pathfinder
+            animal.bounds = bounds
+        self.npc_index.rebuild(self.npcs)
         
-        # Check NPCs
-        self.nearby_npc = None
-        for npc in self.npcs:
-            npc_pos = pygame.math.Vector2(npc.rect.center)
-            distance = player_pos.distance_to(npc_pos)
-            if distance <= self.interaction_distance:
-                self.nearby_npc = npc
-                break
+    def check_nearby_entities(self):
+        """Find the nearest NPC, or failing that the nearest animal, for F key interaction"""
+        self.nearby_npc = self.npc_index.nearest(self.player.rect.center, self.interaction_distance)
         
         # Check animals (only if no NPC nearby)
         self.nearby_animal = None
         if not self.nearby_npc:
-            for animal in self.animals:
-                animal_pos = pygame.math.Vector2(animal.rect.center)
-                distance = player_pos.distance_to(animal_pos)
-                if distance <= self.interaction_distance:
-                    self.nearby_animal = animal
-                    break
+            self.nearby_animal = self.animal_index.nearest(self.player.rect.center, self.interaction_distance)
     
     def interact_with_npc(self, npc):
         """Interact with an NPC"""
@@ -448,6 +479,22 @@ class FarmGame:
         self.notification = message
         self.notification_timer = 120
         
+    def enter_scene(self, name, pos):
+        """Move the player into a scene at a pixel position"""
+        self.scene, self.world = self.scenes.switch(name)
+        self.animals, self.npcs = self.scene_sprites.setdefault(name, (self.create_animal_group(), pygame.sprite.Group()))
+        self.nearby_npc = None
+        self.nearby_animal = None
+        self.index_entities()
+        self.previous_positions.clear()
+        
+        world_width, world_height = self.world.width * TILE_SIZE, self.world.height * TILE_SIZE
+        self.player.bounds = pygame.Rect(0, 0, world_width, world_height)
+        self.player.rect.center = pos
+        self.player.hitbox.center = pos
+        self.camera.set_world_size(world_width, world_height)
+        self.camera.follow(self.player.rect)
+        
     def update(self, dt):
         """Update all game systems"""
         if self.paused:
@@ -457,15 +504,26 @@ class FarmGame:
         
         # Update systems
         self.player.update(keys, dt)
+        
+        # Walk through doors, loading the scene behind one as the player approaches
+        door = self.scenes.find_door(self.player.rect)
+        if door:
+            self.enter_scene(door.target, door.target_center)
+        else:
+            self.scenes.preload_near(self.player.rect)
+            
+        self.camera.follow(self.player.rect)
+        self.world.load_chunks_near(self.camera.rect)
         self.world.update()
         self.time_system.update(dt)
         
         # Check for nearby entities
         self.check_nearby_entities()
         
-        # Update animals
-        for animal in self.animals:
-            animal.update(dt)
+        # Update animals - those whose feed or product timer ran out this step move on first
+        for animal in Animal.timers.advance():
+            animal.on_timer()
+        self.update_animals(dt)
             
         # Update NPCs
         for npc in self.npcs:
@@ -499,87 +557,306 @@ class FarmGame:
         else:
             self.last_money_check = self.player.money
                 
-    def draw(self):
-        """Draw everything"""
-        # Clear screen with black
-        self.screen.fill(BLACK)
+    def get_interaction_prompt(self):
+        """Get (x, y, text) of the current interaction prompt, or None"""
+        if self.nearby_npc:
+            return (self.nearby_npc.rect.centerx,
+                    self.nearby_npc.rect.top - 30,
+                    f"Press [F] to talk to {self.nearby_npc.npc_type.title()}")
+        elif self.nearby_animal:
+            if self.nearby_animal.can_collect():
+                action = "Collect"
+            elif self.nearby_animal.can_feed():
+                action = "Feed"
+            else:
+                action = "Check"
+            return (self.nearby_animal.rect.centerx,
+                    self.nearby_animal.rect.top - 30,
+                    f"Press [F] to {action} {self.nearby_animal.animal_type.title()}")
+        return None
         
-        # Draw world to world surface
-        self.world_surface.fill(BLACK)
-        self.world.tiles.draw(self.world_surface)
+    def get_prompt_alpha(self):
+        """Get the current alpha of the fading interaction prompt"""
+        fade_progress = self.prompt_timer / self.prompt_fade_duration
+        return int(255 * (1 - fade_progress))
+        
+    def get_mouse_world_pos(self):
+        """Get the world position under the mouse, or None if hints are hidden"""
+        if self.inventory.show_full_inventory:
+            return None
+        screen_mouse_pos = pygame.mouse.get_pos()
+        if not self.is_click_in_world(screen_mouse_pos):
+            return None
+        return self.screen_to_world_pos(screen_mouse_pos)
+        
+    def has_modal_overlay(self):
+        """Check if a full-screen menu or popup is covering the game"""
+        return (self.inventory.show_full_inventory or
+                self.quest_system.show_quest_tab or
+                self.shopkeeper.shop_mode or
+                self.show_exit_confirmation or
+                (self.last_completed_quest and self.quest_notification_timer > 0))
+                
+    def collect_dirty_rects(self):
+        """Work out which screen regions changed this frame (None = redraw everything)"""
+        # World-wide changes force a full redraw
+        darkness = self.time_system.get_darkness_alpha() if self.time_system.is_night() else 0
+        world_state = (frozenset(self.plot_system.claimed_plots),
+                       frozenset(self.plot_system.locked_plots),
+                       darkness, self.show_grid, self.camera.offset, self.scene.name)
+        if world_state != self.world_state:
+            self.world_state = world_state
+            self.world_dirty.invalidate()
+            
+        # Tiles changed by tilling or watering
+        for change in self.world.journal.drain("render"):
+            grid_x, grid_y = change.grid_pos
+            self.world_dirty.mark(pygame.Rect(grid_x * TILE_SIZE, grid_y * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+            
+        # World-space drawables in view
+        visible = self.camera.rect
+        for crop in self.get_visible_crops(visible):
+            bounds = crop.get_bounds()
+            if bounds.colliderect(visible):
+                self.world_dirty.track(crop, bounds, (crop.stage, crop.ready_to_harvest, crop.needs_water))
+        for animal in self.get_visible_animals(visible):
+            bounds = animal.get_bounds()
+            if bounds.colliderect(visible):
+                self.world_dirty.track(animal, bounds, animal.state)
+        for npc in self.npcs:
+            bounds = npc.get_bounds()
+            if bounds.colliderect(visible):
+                self.world_dirty.track(npc, bounds, (npc.dialogue_visible, npc.current_dialogue))
+        self.world_dirty.track(self.player, self.player.rect, id(self.player.image))
+        
+        prompt = self.get_interaction_prompt()
+        alpha = self.get_prompt_alpha()
+        if prompt and alpha > 0:
+            self.world_dirty.track("prompt", self.get_interaction_prompt_rect(*prompt), (prompt[2], alpha))
+            
+        world_mouse_pos = self.get_mouse_world_pos()
+        if world_mouse_pos and self.scene.plots:
+            hint_rect = self.plot_system.get_hint_rect(world_mouse_pos, self.world, self.player)
+            if hint_rect:
+                grid_pos = (world_mouse_pos[0] // TILE_SIZE, world_mouse_pos[1] // TILE_SIZE)
+                self.world_dirty.track("hint", hint_rect,
+                                       self.plot_system.get_hint(grid_pos, self.world, self.player))
+                                       
+        # Screen-space UI
+        self.screen_dirty.track("stats", self.ui.get_stats_rect(),
+                                self.ui.get_stats_signature(self.player, self.time_system))
+        if self.ui.show_controls:
+            self.screen_dirty.track("controls", self.ui.get_controls_rect(self.screen_width, self.screen_height), None)
+        self.screen_dirty.track("hotbar", self.inventory.get_hotbar_rect(self.screen_width, self.screen_height),
+                                self.inventory.get_hotbar_signature())
+        if self.notification:
+            self.screen_dirty.track("notification",
+                                    self.ui.get_notification_rect(self.notification, self.screen_width, self.screen_height),
+                                    self.notification)
+        self.screen_dirty.track("settings",
+                                self.ui.get_settings_button_rect(self.screen_width, self.screen_height), None)
+                                
+        world_rects = self.world_dirty.end_frame()
+        screen_rects = self.screen_dirty.end_frame()
+        if world_rects is None or screen_rects is None or self.has_modal_overlay():
+            return None
+            
+        view_rect = self.world_surface.get_rect()
+        for rect in world_rects:
+            rect = self.camera.world_rect_to_view(rect).clip(view_rect)
+            if rect.width > 0 and rect.height > 0:
+                screen_rects.append(self.viewport.world_rect_to_screen(rect))
+        dirty_rects = DirtyRectTracker.merge(screen_rects)
+        
+        # UI elements are always redrawn whole, so grow the regions over any they touch
+        hud_rects = self.get_hud_rects()
+        while True:
+            touched = [rect for rect in hud_rects
+                       if rect.collidelist(dirty_rects) != -1
+                       and not any(dirty.contains(rect) for dirty in dirty_rects)]
+            if not touched:
+                return dirty_rects
+            dirty_rects = DirtyRectTracker.merge(dirty_rects + touched)
+            
+    def get_hud_rects(self):
+        """Get the screen rects of the always-visible UI elements"""
+        hud_rects = [self.ui.get_stats_rect(),
+                     self.inventory.get_hotbar_rect(self.screen_width, self.screen_height),
+                     self.ui.get_settings_button_rect(self.screen_width, self.screen_height)]
+        if self.ui.show_controls:
+            hud_rects.append(self.ui.get_controls_rect(self.screen_width, self.screen_height))
+        if self.notification:
+            hud_rects.append(self.ui.get_notification_rect(self.notification, self.screen_width, self.screen_height))
+        return hud_rects
+        
+    def get_visible_crops(self, area):
+        """Get crops that may be drawn inside a world-space area"""
+        # Status indicators reach above the crop, so include the row below the area
+        return self.world.get_crops_in_area(pygame.Rect(area.x, area.y, area.width, area.height + TILE_SIZE))
+        
+    def get_visible_animals(self, area):
+        """Get animals that may be drawn inside a world-space area"""
+        # Indexed by centre, so reach far enough for the sprite and status above it
+        return self.animal_index.query_rect(area.inflate(SPATIAL_CELL_SIZE * 2, SPATIAL_CELL_SIZE * 2))
+        
+    def draw_world(self, area=None):
+        """Draw the part of the game world the camera sees, optionally only inside area"""
+        surface = self.world_surface
+        surface.set_clip(area)
+        surface.fill(BLACK)
+        
+        # Everything is drawn shifted by the camera offset, and only if it is in view
+        offset = self.camera.offset
+        visible = self.camera.rect if area is None else area.move(offset)
+        self.world.draw_tiles(surface, visible, offset)
+        self.scene.draw_doors(surface, visible, offset)
         
         # Draw claimed plot indicators
-        self.plot_system.draw_claimed_indicators(self.world_surface)
+        if self.scene.plots:
+            self.plot_system.draw_claimed_indicators(surface, offset)
         
         # Draw grid if enabled
         if self.show_grid:
-            self.world.draw_grid(self.world_surface)
+            self.world.draw_grid(surface, offset)
+            
+        # Only sprites touching the visible area need drawing
+        crops = [crop for crop in self.get_visible_crops(visible) if crop.get_bounds().colliderect(visible)]
+        animals = [animal for animal in self.get_visible_animals(visible) if animal.get_bounds().colliderect(visible)]
+        npcs = [npc for npc in self.npcs if npc.get_bounds().colliderect(visible)]
+            
+        # Draw crops and their status indicators
+        for crop in crops:
+            surface.blit(crop.image, self.camera.world_rect_to_view(crop.rect))
+        for crop in crops:
+            crop.draw_status(surface, offset)
             
-        # Draw crops
-        self.world.crops.draw(self.world_surface)
-        
-        # Draw crop status indicators
-        for crop in self.world.crops:
-            crop.draw_status(self.world_surface)
-        
         # Draw animals
-        self.animals.draw(self.world_surface)
-        for animal in self.animals:
-            animal.draw_status(self.world_surface)
+        for animal in animals:
+            surface.blit(animal.image, self.camera.world_rect_to_view(animal.rect))
+        for animal in animals:
+            animal.draw_status(surface, offset)
             
         # Draw NPCs
-        self.npcs.draw(self.world_surface)
-        for npc in self.npcs:
-            npc.draw_label(self.world_surface)
-            npc.draw_dialogue(self.world_surface)
+        for npc in npcs:
+            surface.blit(npc.image, self.camera.world_rect_to_view(npc.rect))
+        for npc in npcs:
+            npc.draw_label(surface, offset)
+            npc.draw_dialogue(surface, offset)
             
         # Draw player
-        self.world_surface.blit(self.player.image, self.player.rect)
+        surface.blit(self.player.image, self.camera.world_rect_to_view(self.player.rect))
         
         # Draw interaction prompt (in world space)
-        if self.nearby_npc:
-            self.draw_interaction_prompt_world(self.world_surface, 
-                                              self.nearby_npc.rect.centerx, 
-                                              self.nearby_npc.rect.top - 30, 
-                                              f"Press [F] to talk to {self.nearby_npc.npc_type.title()}")
-        elif self.nearby_animal:
-            if self.nearby_animal.can_collect():
-                action = "Collect"
-            elif self.nearby_animal.can_feed():
-                action = "Feed"
-            else:
-                action = "Check"
-            self.draw_interaction_prompt_world(self.world_surface,
-                                              self.nearby_animal.rect.centerx, 
-                                              self.nearby_animal.rect.top - 30,
-                                              f"Press [F] to {action} {self.nearby_animal.animal_type.title()}")
+        prompt = self.get_interaction_prompt()
+        if prompt:
+            x, y, text = prompt
+            self.draw_interaction_prompt_world(surface, x - offset[0], y - offset[1], text)
         
         # Draw claimable/sellable plot hint (only if inventory not open) - in world space
-        if not self.inventory.show_full_inventory:
-            screen_mouse_pos = pygame.mouse.get_pos()
-            if self.is_click_in_world(screen_mouse_pos):
-                world_mouse_pos = self.screen_to_world_pos(screen_mouse_pos)
-                self.plot_system.draw_claimable_hint(self.world_surface, world_mouse_pos, self.world, self.player)
+        world_mouse_pos = self.get_mouse_world_pos()
+        if world_mouse_pos and self.scene.plots:
+            self.plot_system.draw_claimable_hint(surface, world_mouse_pos, self.world, self.player, offset)
         
         # Apply darkness for night
         if self.time_system.is_night():
-            darkness = pygame.Surface((self.world_width, self.world_height))
-            darkness.set_alpha(self.time_system.get_darkness_alpha())
-            darkness.fill((0, 0, 40))
-            self.world_surface.blit(darkness, (0, 0))
+            surface.blit(self.get_darkness_overlay(self.time_system.get_darkness_alpha()), (0, 0))
+            
+        surface.set_clip(None)
+        
+    def get_darkness_overlay(self, alpha):
+        """Get the darkness overlay at the given alpha, rebuilding it only if the world size changed"""
+        size = self.world_surface.get_size()
+        if self.darkness_overlay is None or self.darkness_overlay.get_size() != size:
+            self.darkness_overlay = pygame.Surface(size)
+            self.darkness_overlay.fill((0, 0, 40))
+        if self.darkness_overlay.get_alpha() != alpha:
+            self.darkness_overlay.set_alpha(alpha)
+        return self.darkness_overlay
+        
+    def draw_hud(self, area=None):
+        """Draw the always-visible UI, optionally only the parts touching area"""
+        def visible(rect):
+            return area is None or rect.colliderect(area)
+            
+        if visible(self.ui.get_stats_rect()):
+            self.ui.draw_player_stats(self.screen, self.player, self.time_system)
+        if self.ui.show_controls and visible(self.ui.get_controls_rect(self.screen_width, self.screen_height)):
+            self.ui.draw_controls(self.screen, self.screen_width, self.screen_height)
+        if visible(self.inventory.get_hotbar_rect(self.screen_width, self.screen_height)):
+            self.inventory.draw(self.screen, self.screen_width, self.screen_height)
+        if self.notification and visible(self.ui.get_notification_rect(self.notification,
+                                                                       self.screen_width, self.screen_height)):
+            self.ui.draw_notification(self.screen, self.notification, self.screen_width, self.screen_height)
+        if visible(self.ui.get_settings_button_rect(self.screen_width, self.screen_height)):
+            self.settings_button_rect = self.ui.draw_settings_button(self.screen, self.screen_width, self.screen_height)
+            
+    def save_positions(self):
+        """Remember where the player and the animals in view are before a simulation step"""
+        self.previous_positions = {self.player: self.player.rect.topleft}
+        for animal in self.get_visible_animals(self.camera.rect):
+            self.previous_positions[animal] = animal.rect.topleft
+            
+    def draw_interpolated(self, alpha):
+        """Draw with moving sprites part of the way (alpha) from their previous to their current step"""
+        current_positions = {}
+        for sprite, (x, y) in self.previous_positions.items():
+            current_x, current_y = current_positions[sprite] = sprite.rect.topleft
+            sprite.rect.topleft = (round(x + (current_x - x) * alpha), round(y + (current_y - y) * alpha))
+        self.camera.follow(self.player.rect)
         
-        # Scale world to fill window while maintaining aspect ratio
-        scale_x = self.screen_width / self.world_width
-        scale_y = self.screen_height / self.world_height
-        scale = min(scale_x, scale_y)
+        self.draw()
         
-        scaled_width = int(self.world_width * scale)
-        scaled_height = int(self.world_height * scale)
-        offset_x = (self.screen_width - scaled_width) // 2
-        offset_y = (self.screen_height - scaled_height) // 2
+        for sprite, pos in current_positions.items():
+            sprite.rect.topleft = pos
+        self.camera.follow(self.player.rect)
         
-        scaled_surface = pygame.transform.scale(self.world_surface, (scaled_width, scaled_height))
-        self.screen.blit(scaled_surface, (offset_x, offset_y))
+    def draw(self):
+        """Draw everything"""
+        if DIRTY_RECT_RENDERING:
+            dirty_rects = self.collect_dirty_rects()
+            if dirty_rects is not None:
+                if dirty_rects:
+                    self.draw_dirty(dirty_rects)
+                    pygame.display.update(dirty_rects)
+                return
+                
+        self.draw_full()
+        
+        # Update display
+        pygame.display.flip()
+        
+    def draw_dirty(self, dirty_rects):
+        """Redraw only the given screen regions"""
+        # Repaint the parts of the world under the dirty regions and rescale them
+        world_rects = [self.viewport.screen_rect_to_world(rect) for rect in dirty_rects]
+        world_rects = [rect for rect in world_rects if rect.width > 0 and rect.height > 0]
+        for world_rect in world_rects:
+            self.draw_world(world_rect)
+        self.viewport.refresh(self.world_surface, world_rects)
+        
+        for rect in dirty_rects:
+            self.screen.set_clip(rect)
+            self.screen.fill(BLACK)
+            
+            world_rect = self.viewport.screen_rect_to_world(rect)
+            if world_rect.width > 0 and world_rect.height > 0:
+                self.viewport.blit(self.screen, self.world_surface, world_rect)
+                
+            self.draw_hud(rect)
+            
+        self.screen.set_clip(None)
+        
+    def draw_full(self):
+        """Redraw the whole frame"""
+        # Clear screen with black
+        self.screen.fill(BLACK)
+        
+        # Draw world to world surface
+        self.draw_world()
+        
+        # Scale world to fill window while maintaining aspect ratio
+        self.viewport.refresh(self.world_surface)
+        self.viewport.blit(self.screen, self.world_surface)
         
         # Draw UI elements (screen space)
         self.ui.draw_player_stats(self.screen, self.player, self.time_system)
@@ -616,21 +893,24 @@ class FarmGame:
         if self.show_exit_confirmation:
             self.draw_exit_confirmation()
             
-        # Update display
-        pygame.display.flip()
+    def get_interaction_prompt_rect(self, x, y, text):
+        """Get the rect covered by an interaction prompt"""
+        padding = 6
+        text_width, text_height = self.prompt_font.size(text)
+        bg_width = text_width + padding * 2
+        bg_height = text_height + padding * 2
+        return pygame.Rect(x - bg_width // 2, y, bg_width, bg_height)
     
     def draw_interaction_prompt_world(self, surface, x, y, text):
         """Draw interaction prompt in world space with fade-out animation"""
         # Calculate alpha based on timer - fade from 255 to 0 over 2 seconds
-        fade_progress = self.prompt_timer / self.prompt_fade_duration
-        alpha = int(255 * (1 - fade_progress))
+        alpha = self.get_prompt_alpha()
         
         # Don't draw if fully faded
         if alpha <= 0:
             return
         
-        prompt_font = pygame.font.Font(None, 18)
-        text_surface = prompt_font.render(text, True, WHITE)
+        text_surface = render_text(self.prompt_font, text, True, WHITE)
         
         # Background
         padding = 6
@@ -649,11 +929,8 @@ class FarmGame:
         pygame.draw.rect(border_surface, (*YELLOW, alpha), (0, 0, bg_width, bg_height), 2)
         surface.blit(border_surface, (bg_x, bg_y))
         
-        # Text with alpha
-        text_with_alpha = pygame.Surface((text_surface.get_width(), text_surface.get_height()), pygame.SRCALPHA)
-        text_with_alpha.fill((0, 0, 0, 0))
-        temp_text = prompt_font.render(text, True, (*WHITE, alpha))
-        text_with_alpha.blit(temp_text, (0, 0))
+        # Text with alpha - faded on a copy, so every step of the fade reuses the one cached render
+        text_with_alpha = text_surface.copy()
         text_with_alpha.set_alpha(alpha)
         
         text_x = bg_x + padding
@@ -679,23 +956,23 @@ class FarmGame:
         pygame.draw.rect(self.screen, (200, 200, 200), (dialog_x, dialog_y, dialog_width, dialog_height), 3)
         
         # Title text
-        title_font = pygame.font.Font(None, 36)
-        title_text = title_font.render("Exit Game?", True, WHITE)
+        title_font = get_font(36)
+        title_text = render_text(title_font, "Exit Game?", True, WHITE)
         title_x = dialog_x + (dialog_width - title_text.get_width()) // 2
         title_y = dialog_y + 20
         self.screen.blit(title_text, (title_x, title_y))
         
         # Message text
-        message_font = pygame.font.Font(None, 24)
-        message_text = message_font.render("Do you want to exit the game?", True, WHITE)
+        message_font = get_font(24)
+        message_text = render_text(message_font, "Do you want to exit the game?", True, WHITE)
         message_x = dialog_x + (dialog_width - message_text.get_width()) // 2
         message_y = dialog_y + 60
         self.screen.blit(message_text, (message_x, message_y))
         
         # Instructions
-        instruction_font = pygame.font.Font(None, 22)
-        yes_text = instruction_font.render("Press [Y] for Yes", True, (100, 255, 100))
-        no_text = instruction_font.render("Press [N] for No", True, (255, 100, 100))
+        instruction_font = get_font(22)
+        yes_text = render_text(instruction_font, "Press [Y] for Yes", True, (100, 255, 100))
+        no_text = render_text(instruction_font, "Press [N] for No", True, (255, 100, 100))
         
         yes_x = dialog_x + dialog_width // 4 - yes_text.get_width() // 2
         no_x = dialog_x + 3 * dialog_width // 4 - no_text.get_width() // 2
@@ -707,6 +984,7 @@ class FarmGame:
     def save_game(self):
         """Save game state"""
         save_data = {
+            "scene": self.scene.name,
             "player": {
                 "pos": self.player.rect.center,
                 "money": self.player.money,
@@ -720,7 +998,13 @@ class FarmGame:
                 "season": self.time_system.season
             },
             "plots": self.plot_system.save_data(),
-            "quests": self.quest_system.save_data()
+            "quests": self.quest_system.save_data(),
+            "worlds": self.scenes.save_data(),
+            "animals": {name: [animal.save_data() for animal in animals]
+                        for name, (animals, npcs) in self.scene_sprites.items()},
+            "herds": {name: animals.save_data() for name, (animals, npcs) in self.scene_sprites.items()
+                      if isinstance(animals, Herd)},
+            "random": streams.save_data()
         }
         
         try:
@@ -736,8 +1020,36 @@ class FarmGame:
             with open("save_game.json", "r") as f:
                 save_data = json.load(f)
                 
-            # Restore player
-            self.player.rect.center = tuple(save_data["player"]["pos"])
+            # Restore tiles and crops - crops catch up on the time since saving as their chunks load
+            if "worlds" in save_data:
+                self.scenes.load_data(save_data["worlds"])
+                
+            # Restore the world seed before animals are recreated, so new streams carry on from the saved ones
+            if "random" in save_data:
+                streams.load_data(save_data["random"])
+                
+            # Restore animals
+            if "animals" in save_data:
+                for name, animals_data in save_data["animals"].items():
+                    old_animals, npcs = self.scene_sprites.get(name, (None, pygame.sprite.Group()))
+                    if old_animals:
+                        # Their timers would otherwise keep them alive and firing after they are replaced
+                        for animal in old_animals:
+                            animal.timers.cancel(animal)
+                        old_animals.empty()
+                        
+                    # A new group, so a herd's generator is seeded from the restored streams
+                    animals = self.create_animal_group()
+                    if isinstance(animals, Herd) and name in save_data.get("herds", {}):
+                        animals.load_data(save_data["herds"][name])
+                    self.scene_sprites[name] = (animals, npcs)
+                    for animal_data in animals_data:
+                        animal = Animal(tuple(animal_data["pos"]), animal_data["animal_type"])
+                        animal.load_data(animal_data)
+                        animals.add(animal)
+                        
+            # Restore player, in the scene they were saved in
+            self.enter_scene(save_data.get("scene", FARM_SCENE), tuple(save_data["player"]["pos"]))
             self.player.money = save_data["player"]["money"]
             self.player.energy = save_data["player"]["energy"]
             
@@ -775,12 +1087,23 @@ class FarmGame:
         # Try to load save
         self.load_game()
         
+        accumulator = 0.0
         while True:
-            dt = self.clock.tick(FPS) / 16.67
-            
+            accumulator += self.clock.tick(FPS) / 1000
             self.handle_events()
-            self.update(dt)
-            self.draw()
+            
+            # Advance the game in fixed steps, however fast or slow frames are drawn
+            steps = 0
+            while accumulator >= SIM_STEP:
+                if steps == MAX_SIM_STEPS:
+                    accumulator = 0.0  # Too far behind - skip ahead rather than spiral
+                    break
+                self.save_positions()
+                self.update(1)
+                accumulator -= SIM_STEP
+                steps += 1
+                
+            self.draw_interpolated(accumulator / SIM_STEP)
 
 if __name__ == "__main__":
     game = FarmGame()
@@ -0,0 +1,192 @@
+import mmap
+import os
+import struct
+import sys
+
+# Binary map layout: header, then width*height kind bytes, then the object layer if present
+MAGIC = b"FMAP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")  # magic, version, flags, width, height
+HAS_OBJECTS = 1
+
+class MapData:
+    """A map as packed byte grids - one tile character code per cell (0 = nothing)"""
+    
+    def __init__(self, width, height, kinds, objects=None, source=None):
+        self.width = width
+        self.height = height
+        self.kinds = kinds  # bytes, or a memoryview into a memory-mapped file
+        self.objects = objects  # Same layout as kinds, or None
+        self.source = source  # Memory map backing the grids, kept open while they are used
+        
+    def get_row(self, grid_y, start_x, end_x):
+        """Get the tile codes of part of a row as bytes"""
+        start = grid_y * self.width
+        return bytes(self.kinds[start + start_x:start + end_x])
+        
+    def get_object(self, grid_pos):
+        """Get the object character at a grid position, or None"""
+        if self.objects is None:
+            return None
+        code = self.objects[grid_pos[1] * self.width + grid_pos[0]]
+        return chr(code) if code else None
+        
+    def close(self):
+        """Release the memory map behind a binary map"""
+        if self.source is not None:
+            self.kinds.release()
+            if self.objects is not None:
+                self.objects.release()
+            self.source.close()
+            self.source = None
+
+def pack_rows(rows, width, empty=b" "):
+    """Pack text rows into one width*len(rows) byte grid, empty cells becoming 0"""
+    table = bytes(range(256)).replace(empty, b"\0") if empty else None
+    packed = bytearray()
+    for row in rows:
+        codes = row.encode("ascii")[:width]
+        if table:
+            codes = codes.translate(table)
+        packed += codes
+        packed += bytes(width - len(codes))
+    return bytes(packed)
+
+def read_text_rows(filepath):
+    """Read the rows of a text map, keeping leading spaces so columns stay aligned"""
+    with open(filepath) as f:
+        rows = [row.rstrip("\r\n") for row in f]
+    # Drop trailing blank lines
+    while rows and not rows[-1].strip():
+        rows.pop()
+    return rows
+
+def load_object_layer(filepath, width, height):
+    """Pack a text object layer into a width*height grid, "." marking empty cells (None if there is no layer)"""
+    object_rows = read_text_rows(filepath) if filepath and os.path.exists(filepath) else []
+    if not object_rows:
+        return None
+    objects = pack_rows(object_rows[:height], width, b".")
+    return objects + bytes(width * height - len(objects))
+
+def load_text_map(filepath, objects_path=None):
+    """Load a text map (one character per tile) and an optional object layer of the same shape"""
+    rows = read_text_rows(filepath)
+    width = max((len(row) for row in rows), default=0)
+    height = len(rows)
+    return MapData(width, height, pack_rows(rows, width), load_object_layer(objects_path, width, height))
+
+def load_binary_map(filepath):
+    """Memory-map a binary map - no per-cell Python objects are created"""
+    with open(filepath, "rb") as f:
+        source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+    magic, version, flags, width, height = HEADER.unpack_from(source)
+    if magic != MAGIC or version != VERSION:
+        source.close()
+        raise ValueError(f"{filepath} is not a version {VERSION} binary map")
+        
+    size = width * height
+    view = memoryview(source)
+    kinds = view[HEADER.size:HEADER.size + size]
+    objects = None
+    if flags & HAS_OBJECTS:
+        objects = view[HEADER.size + size:HEADER.size + 2 * size]
+    view.release()
+    return MapData(width, height, kinds, objects, source)
+
+def is_binary_map(filepath):
+    """Check a file's magic number"""
+    with open(filepath, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def load_map(filepath, objects_path=None):
+    """Load a map in either format"""
+    if is_binary_map(filepath):
+        return load_binary_map(filepath)
+    return load_text_map(filepath, objects_path)
+
+def save_binary_map(map_data, filepath):
+    """Write a map in the binary format"""
+    flags = HAS_OBJECTS if map_data.objects is not None else 0
+    with open(filepath, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, flags, map_data.width, map_data.height))
+        f.write(map_data.kinds)
+        if map_data.objects is not None:
+            f.write(map_data.objects)
+
+def unpack_rows(grid, width, height, empty):
+    """Turn a packed byte grid back into text rows"""
+    rows = []
+    for grid_y in range(height):
+        row = bytes(grid[grid_y * width:(grid_y + 1) * width]).replace(b"\0", empty)
+        rows.append(row.decode("ascii"))
+    return rows
+
+def save_text_map(map_data, filepath, objects_path=None):
+    """Write a map (and its object layer, if any) in the text format"""
+    with open(filepath, "w") as f:
+        for row in unpack_rows(map_data.kinds, map_data.width, map_data.height, b" "):
+            f.write(row + "\n")
+            
+    if objects_path and map_data.objects is not None:
+        with open(objects_path, "w") as f:
+            for row in unpack_rows(map_data.objects, map_data.width, map_data.height, b"."):
+                f.write(row + "\n")
+
+def convert(source_path, target_path, objects_path=None):
+    """Convert a map between formats - binary files become text and text files become binary"""
+    map_data = load_map(source_path, objects_path)
+    try:
+        if map_data.source is not None:
+            save_text_map(map_data, target_path, objects_path)
+        else:
+            save_binary_map(map_data, target_path)
+    finally:
+        map_data.close()
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--bench"]:
+        # Benchmark: python map_format.py --bench [SIZE] - times loading one random SIZE*SIZE map as text and as binary
+        import random
+        import tempfile
+        import time
+        import tracemalloc
+        from settings import VIEW_WIDTH, VIEW_HEIGHT
+        
+        def load_first_screen(load, path):
+            """Load a map and read the rows of the first screenful, as the world does before anything is drawn"""
+            map_data = load(path)
+            for grid_y in range(min(VIEW_HEIGHT, map_data.height)):
+                map_data.get_row(grid_y, 0, min(VIEW_WIDTH, map_data.width))
+            return map_data
+            
+        size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+        repeats = 5
+        rng = random.Random(size)
+        with tempfile.TemporaryDirectory() as folder:
+            text_path = os.path.join(folder, "map.txt")
+            binary_path = os.path.join(folder, "map.fmap")
+            with open(text_path, "w") as f:
+                for _ in range(size):
+                    f.write("".join(rng.choices("GGGGGSWTRF", k=size)) + "\n")
+            convert(text_path, binary_path)
+            
+            for name, path, load in (("text", text_path, load_text_map), ("binary", binary_path, load_binary_map)):
+                start = time.perf_counter()
+                for _ in range(repeats):
+                    load_first_screen(load, path).close()
+                load_ms = (time.perf_counter() - start) / repeats * 1000
+                
+                tracemalloc.start()
+                map_data = load_first_screen(load, path)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                map_data.close()
+                print(f"{size}x{size} {name}: {load_ms:.2f} ms, {peak / 1024:.0f} KB peak")
+        sys.exit(0)
+        
+    if len(sys.argv) not in (3, 4):
+        print("usage: python map_format.py SOURCE TARGET [OBJECTS] | --bench [SIZE]")
+        sys.exit(1)
+    convert(*sys.argv[1:])
@@ -1,5 +1,6 @@
 import pygame
 from settings import *
+from fonts import get_font, render_text
 from crop import Crop
 
 class NPC(pygame.sprite.Sprite):
@@ -52,8 +53,9 @@ class NPC(pygame.sprite.Sprite):
         self.current_dialogue = 0
         self.dialogue_visible = False
         self.dialogue_timer = 0
-        self.font = pygame.font.Font(None, 18)
-        self.title_font = pygame.font.Font(None, 24)
+        self.font = get_font(18)
+        self.title_font = get_font(24)
+        self.label_font = get_font(16)
         
         # Shop state
         self.shop_mode = None  # None, 'menu', 'buy', or 'sell'
@@ -101,26 +103,56 @@ class NPC(pygame.sprite.Sprite):
             if self.dialogue_timer <= 0:
                 self.dialogue_visible = False
                 
-    def draw_dialogue(self, surface):
+    def get_dialogue_rect(self):
+        """Get the rect of the dialogue bubble, or None if hidden"""
+        if not self.dialogue_visible or self.npc_type == "shopkeeper":
+            return None
+            
+        dialogue = self.data["dialogues"][self.current_dialogue - 1]
+        padding = 10
+        text_width, text_height = self.font.size(dialogue)
+        box_width = text_width + padding * 2
+        box_height = text_height + padding * 2
+        
+        # Position above NPC
+        box_x = self.rect.centerx - box_width // 2
+        box_y = self.rect.top - box_height - 10
+        
+        # Keep on screen (use world surface dimensions)
+        world_width = TILE_SIZE * MAP_WIDTH
+        box_x = max(5, min(box_x, world_width - box_width - 5))
+        box_y = max(5, box_y)
+        return pygame.Rect(box_x, box_y, box_width, box_height)
+        
+    def get_label_rect(self):
+        """Get the rect of the name label, or None if the NPC has none"""
+        if self.npc_type != "shopkeeper":
+            return None
+        label_width, label_height = self.label_font.size("SHOP")
+        label_x = self.rect.centerx - label_width // 2 - 3
+        label_y = self.rect.top - 20
+        return pygame.Rect(label_x, label_y, label_width + 6, label_height + 4)
+        
+    def get_bounds(self):
+        """Get rect covering the NPC, its label and dialogue bubble"""
+        bounds = self.rect.copy()
+        for rect in (self.get_label_rect(), self.get_dialogue_rect()):
+            if rect:
+                bounds.union_ip(rect)
+        return bounds
+        
+    def draw_dialogue(self, surface, offset=(0, 0)):
         """Draw dialogue bubble"""
-        if self.dialogue_visible and self.npc_type != "shopkeeper":
+        box = self.get_dialogue_rect()
+        if box:
+            box = box.move(-offset[0], -offset[1])
+            rect = self.rect.move(-offset[0], -offset[1])
             dialogue = self.data["dialogues"][self.current_dialogue - 1]
             
             # Create dialogue box
             padding = 10
-            text_surface = self.font.render(dialogue, True, BLACK)
-            box_width = text_surface.get_width() + padding * 2
-            box_height = text_surface.get_height() + padding * 2
-            
-            # Position above NPC
-            box_x = self.rect.centerx - box_width // 2
-            box_y = self.rect.top - box_height - 10
-            
-            # Keep on screen (use world surface dimensions)
-            world_width = TILE_SIZE * MAP_WIDTH
-            world_height = TILE_SIZE * MAP_HEIGHT
-            box_x = max(5, min(box_x, world_width - box_width - 5))
-            box_y = max(5, box_y)
+            text_surface = render_text(self.font, dialogue, True, BLACK)
+            box_x, box_y, box_width, box_height = box
             
             # Draw box
             pygame.draw.rect(surface, WHITE, (box_x, box_y, box_width, box_height))
@@ -128,9 +160,9 @@ class NPC(pygame.sprite.Sprite):
             
             # Draw pointer
             points = [
-                (self.rect.centerx, self.rect.top - 5),
-                (self.rect.centerx - 5, box_y + box_height),
-                (self.rect.centerx + 5, box_y + box_height)
+                (rect.centerx, rect.top - 5),
+                (rect.centerx - 5, box_y + box_height),
+                (rect.centerx + 5, box_y + box_height)
             ]
             pygame.draw.polygon(surface, WHITE, points)
             pygame.draw.lines(surface, BLACK, True, points, 2)
@@ -138,17 +170,17 @@ class NPC(pygame.sprite.Sprite):
             # Draw text
             surface.blit(text_surface, (box_x + padding, box_y + padding))
             
-    def draw_label(self, surface):
+    def draw_label(self, surface, offset=(0, 0)):
         """Draw name label above NPC"""
-        if self.npc_type == "shopkeeper":
-            label_font = pygame.font.Font(None, 16)
-            label = label_font.render("SHOP", True, (255, 215, 0))
-            label_bg = pygame.Surface((label.get_width() + 6, label.get_height() + 4))
+        label_rect = self.get_label_rect()
+        if label_rect:
+            label_rect = label_rect.move(-offset[0], -offset[1])
+            label = render_text(self.label_font, "SHOP", True, (255, 215, 0))
+            label_bg = pygame.Surface(label_rect.size)
             label_bg.fill((0, 0, 0))
             label_bg.set_alpha(180)
             
-            label_x = self.rect.centerx - label.get_width() // 2 - 3
-            label_y = self.rect.top - 20
+            label_x, label_y = label_rect.topleft
             
             surface.blit(label_bg, (label_x, label_y))
             surface.blit(label, (label_x + 3, label_y + 2))
@@ -173,18 +205,18 @@ class NPC(pygame.sprite.Sprite):
         pygame.draw.rect(surface, YELLOW, (menu_x, menu_y, menu_width, menu_height), 3)
         
         # Title
-        title = self.title_font.render("Shopkeeper's Store", True, YELLOW)
+        title = render_text(self.title_font, "Shopkeeper's Store", True, YELLOW)
         surface.blit(title, (menu_x + 20, menu_y + 15))
         
         # Greeting
-        greeting = self.font.render("Hello there! What would you like to do?", True, WHITE)
+        greeting = render_text(self.font, "Hello there! What would you like to do?", True, WHITE)
         surface.blit(greeting, (menu_x + 20, menu_y + 55))
         
         # Buy button
         buy_rect = pygame.Rect(menu_x + 40, menu_y + 100, menu_width - 80, 50)
         pygame.draw.rect(surface, (80, 120, 80), buy_rect)
         pygame.draw.rect(surface, WHITE, buy_rect, 3)
-        buy_text = self.title_font.render("BUY SEEDS", True, WHITE)
+        buy_text = render_text(self.title_font, "BUY SEEDS", True, WHITE)
         buy_x = buy_rect.centerx - buy_text.get_width() // 2
         buy_y = buy_rect.centery - buy_text.get_height() // 2
         surface.blit(buy_text, (buy_x, buy_y))
@@ -193,13 +225,13 @@ class NPC(pygame.sprite.Sprite):
         sell_rect = pygame.Rect(menu_x + 40, menu_y + 165, menu_width - 80, 50)
         pygame.draw.rect(surface, (120, 80, 80), sell_rect)
         pygame.draw.rect(surface, WHITE, sell_rect, 3)
-        sell_text = self.title_font.render("SELL CROPS", True, WHITE)
+        sell_text = render_text(self.title_font, "SELL CROPS", True, WHITE)
         sell_x = sell_rect.centerx - sell_text.get_width() // 2
         sell_y = sell_rect.centery - sell_text.get_height() // 2
         surface.blit(sell_text, (sell_x, sell_y))
         
         # Close instruction
-        close_text = self.font.render("Right-click or ESC to close", True, GRAY)
+        close_text = render_text(self.font, "Right-click or ESC to close", True, GRAY)
         surface.blit(close_text, (menu_x + 20, menu_y + menu_height - 30))
     
     def draw_buy_menu(self, surface, player_money, screen_width, screen_height):
@@ -224,11 +256,11 @@ class NPC(pygame.sprite.Sprite):
         pygame.draw.rect(surface, YELLOW, (menu_x, menu_y, menu_width, menu_height), 3)
         
         # Title
-        title = self.title_font.render("Buy Seeds", True, YELLOW)
+        title = render_text(self.title_font, "Buy Seeds", True, YELLOW)
         surface.blit(title, (menu_x + 20, menu_y + 10))
         
         # Money display
-        money = self.font.render(f"Your Money: ${player_money}", True, WHITE)
+        money = render_text(self.font, f"Your Money: ${player_money}", True, WHITE)
         surface.blit(money, (menu_x + 20, menu_y + 40))
         
         # Items
@@ -245,11 +277,11 @@ class NPC(pygame.sprite.Sprite):
             
             # Item name
             name = item.replace("_", " ").title()
-            name_text = self.font.render(name, True, WHITE)
+            name_text = render_text(self.font, name, True, WHITE)
             surface.blit(name_text, (item_rect.x + 10, item_rect.y + 10))
             
             # Price
-            price_text = self.font.render(f"${price}", True, YELLOW if can_buy else GRAY)
+            price_text = render_text(self.font, f"${price}", True, YELLOW if can_buy else GRAY)
             surface.blit(price_text, (item_rect.right - 80, item_rect.y + 10))
             
             y_offset += 50
@@ -258,13 +290,13 @@ class NPC(pygame.sprite.Sprite):
         back_rect = pygame.Rect(menu_x + 40, menu_y + menu_height - 70, 100, 35)
         pygame.draw.rect(surface, (100, 100, 100), back_rect)
         pygame.draw.rect(surface, WHITE, back_rect, 2)
-        back_text = self.font.render("BACK", True, WHITE)
+        back_text = render_text(self.font, "BACK", True, WHITE)
         back_x = back_rect.centerx - back_text.get_width() // 2
         back_y = back_rect.centery - back_text.get_height() // 2
         surface.blit(back_text, (back_x, back_y))
         
         # Instructions
-        instructions = self.font.render("Click item to buy", True, WHITE)
+        instructions = render_text(self.font, "Click item to buy", True, WHITE)
         surface.blit(instructions, (menu_x + 20, menu_y + menu_height - 30))
     
     def draw_sell_menu(self, surface, inventory, player_money, screen_width, screen_height):
@@ -290,16 +322,16 @@ class NPC(pygame.sprite.Sprite):
         pygame.draw.rect(surface, YELLOW, (menu_x, menu_y, menu_width, menu_height), 3)
         
         # Title
-        title = self.title_font.render("Sell Crops & Products", True, YELLOW)
+        title = render_text(self.title_font, "Sell Crops & Products", True, YELLOW)
         surface.blit(title, (menu_x + 20, menu_y + 10))
         
         # Money display
-        money = self.font.render(f"Your Money: ${player_money}", True, WHITE)
+        money = render_text(self.font, f"Your Money: ${player_money}", True, WHITE)
         surface.blit(money, (menu_x + 20, menu_y + 40))
         
         # Items
         if not sellable_items:
-            no_items = self.font.render("You don't have any crops or products to sell!", True, WHITE)
+            no_items = render_text(self.font, "You don't have any crops or products to sell!", True, WHITE)
             surface.blit(no_items, (menu_x + 40, menu_y + 100))
         else:
             y_offset = 80
@@ -313,11 +345,11 @@ class NPC(pygame.sprite.Sprite):
                 
                 # Item name and count
                 name = item.replace("_", " ").title()
-                name_text = self.font.render(f"{name} x{count}", True, WHITE)
+                name_text = render_text(self.font, f"{name} x{count}", True, WHITE)
                 surface.blit(name_text, (item_rect.x + 10, item_rect.y + 10))
                 
                 # Price
-                price_text = self.font.render(f"${price} each", True, YELLOW)
+                price_text = render_text(self.font, f"${price} each", True, YELLOW)
                 surface.blit(price_text, (item_rect.right - 100, item_rect.y + 10))
                 
                 y_offset += 50
@@ -327,7 +359,7 @@ class NPC(pygame.sprite.Sprite):
             sell_all_rect = pygame.Rect(menu_x + menu_width - 150, menu_y + menu_height - 70, 110, 35)
             pygame.draw.rect(surface, (80, 120, 80), sell_all_rect)
             pygame.draw.rect(surface, WHITE, sell_all_rect, 2)
-            sell_all_text = self.font.render("SELL ALL", True, WHITE)
+            sell_all_text = render_text(self.font, "SELL ALL", True, WHITE)
             sell_all_x = sell_all_rect.centerx - sell_all_text.get_width() // 2
             sell_all_y = sell_all_rect.centery - sell_all_text.get_height() // 2
             surface.blit(sell_all_text, (sell_all_x, sell_all_y))
@@ -336,13 +368,13 @@ class NPC(pygame.sprite.Sprite):
         back_rect = pygame.Rect(menu_x + 40, menu_y + menu_height - 70, 100, 35)
         pygame.draw.rect(surface, (100, 100, 100), back_rect)
         pygame.draw.rect(surface, WHITE, back_rect, 2)
-        back_text = self.font.render("BACK", True, WHITE)
+        back_text = render_text(self.font, "BACK", True, WHITE)
         back_x = back_rect.centerx - back_text.get_width() // 2
         back_y = back_rect.centery - back_text.get_height() // 2
         surface.blit(back_text, (back_x, back_y))
         
         # Instructions
-        instructions = self.font.render("Click item to sell one, or SELL ALL", True, WHITE)
+        instructions = render_text(self.font, "Click item to sell one, or SELL ALL", True, WHITE)
         surface.blit(instructions, (menu_x + 20, menu_y + menu_height - 30))
     
     def get_shop_items(self):
@@ -0,0 +1,158 @@
+import heapq
+from collections import OrderedDict
+from itertools import count
+from settings import *
+
+NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+def distance(a, b):
+    """Fewest steps between two grid positions on an open grid"""
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+class Pathfinder:
+    """A* paths and flow fields over a world's tiles, cached until the tiles they depend on change"""
+    
+    def __init__(self, world):
+        self.world = world
+        self.paths = OrderedDict()  # (start, goal) -> steps after start up to goal (None = unreachable), least recently used first
+        self.fields = OrderedDict()  # Goal -> {grid position: next position toward the goal}, least recently used first
+        self.area_goals = {}  # Area -> the goal its agents share (None = nowhere in it to stand)
+        self.sequence = count()  # Tie-breaker so positions with equal cost come out in the order they were found
+        world.journal.subscribe(self.tile_changed)
+        
+    def clear(self):
+        """Forget every cached path and flow field"""
+        self.paths.clear()
+        self.fields.clear()
+        self.area_goals.clear()
+        
+    def is_walkable(self, grid_pos):
+        """Whether a grid position is on the map and free of water, fences, trees, rocks and objects"""
+        kind = self.world.get_kind(grid_pos)
+        return kind is not None and kind not in BLOCKING_TILES and self.world.get_object(grid_pos) is None
+        
+    def find_path(self, start, goal):
+        """Get the shortest path from start to goal as the grid positions after start, or None if there is none"""
+        key = (start, goal)
+        if key in self.paths:
+            self.paths.move_to_end(key)
+            return self.paths[key]
+            
+        path = self.search(start, goal)
+        self.paths[key] = path
+        while len(self.paths) > PATH_CACHE_SIZE:
+            self.paths.popitem(last=False)
+        return path
+        
+    def search(self, start, goal):
+        """A* from start to goal, giving up after PATH_SEARCH_LIMIT tiles"""
+        if not self.is_walkable(goal):
+            return None
+            
+        came_from = {start: None}
+        cost = {start: 0}
+        frontier = [(distance(start, goal), next(self.sequence), start)]
+        expanded = 0
+        while frontier and expanded < PATH_SEARCH_LIMIT:
+            _, _, current = heapq.heappop(frontier)
+            if current == goal:
+                path = []
+                while current != start:
+                    path.append(current)
+                    current = came_from[current]
+                path.reverse()
+                return path
+                
+            expanded += 1
+            for dx, dy in NEIGHBOURS:
+                neighbour = (current[0] + dx, current[1] + dy)
+                new_cost = cost[current] + 1
+                if new_cost < cost.get(neighbour, new_cost + 1) and self.is_walkable(neighbour):
+                    cost[neighbour] = new_cost
+                    came_from[neighbour] = current
+                    heapq.heappush(frontier, (new_cost + distance(neighbour, goal), next(self.sequence), neighbour))
+        return None
+        
+    def get_flow_field(self, goal):
+        """Get the flow field toward a goal, building it the first time it is asked for"""
+        field = self.fields.get(goal)
+        if field is not None:
+            self.fields.move_to_end(goal)
+            return field
+            
+        field = self.build_flow_field(goal)
+        self.fields[goal] = field
+        while len(self.fields) > FLOW_FIELD_CACHE_SIZE:
+            self.fields.popitem(last=False)
+        return field
+        
+    def build_flow_field(self, goal):
+        """Breadth-first search out from the goal, pointing every tile reached at the tile it was reached from"""
+        field = {goal: None}
+        if not self.is_walkable(goal):
+            return field
+            
+        frontier = [goal]
+        for _ in range(FLOW_FIELD_RADIUS):
+            reached = []
+            for current in frontier:
+                for dx, dy in NEIGHBOURS:
+                    neighbour = (current[0] + dx, current[1] + dy)
+                    if neighbour not in field and self.is_walkable(neighbour):
+                        field[neighbour] = current
+                        reached.append(neighbour)
+            frontier = reached
+        return field
+        
+    def get_area_goal(self, grid_pos):
+        """Get the goal shared by everything headed for a grid position's area - its walkable tile nearest the middle"""
+        area = (grid_pos[0] // FLOW_FIELD_AREA_SIZE, grid_pos[1] // FLOW_FIELD_AREA_SIZE)
+        if area not in self.area_goals:
+            left, top = area[0] * FLOW_FIELD_AREA_SIZE, area[1] * FLOW_FIELD_AREA_SIZE
+            middle = (left + FLOW_FIELD_AREA_SIZE // 2, top + FLOW_FIELD_AREA_SIZE // 2)
+            tiles = [(x, y) for y in range(top, top + FLOW_FIELD_AREA_SIZE) for x in range(left, left + FLOW_FIELD_AREA_SIZE)]
+            walkable = [tile for tile in tiles if self.is_walkable(tile)]
+            self.area_goals[area] = min(walkable, key=lambda tile: distance(tile, middle)) if walkable else None
+        goal = self.area_goals[area]
+        return goal if goal else grid_pos
+        
+    def get_next_step(self, grid_pos, goal, route=None):
+        """Get the next grid position toward a goal (None when already there or it can't be reached)"""
+        # Every agent near a goal shares its flow field - only ones further out need a search of their own
+        field = self.get_flow_field(goal)
+        if grid_pos in field:
+            return field[grid_pos]
+        if route is None:
+            path = self.find_path(grid_pos, goal)
+            return path[0] if path else None
+            
+        # The agent keeps its path in route and follows it, searching again only once it strays off or the way is blocked
+        if grid_pos in route:
+            del route[:route.index(grid_pos) + 1]
+        if not route or route[-1] != goal or distance(grid_pos, route[0]) != 1 or not self.is_walkable(route[0]):
+            route[:] = self.find_path(grid_pos, goal) or []
+        return route[0] if route else None
+        
+    def tile_changed(self, change):
+        """Drop the paths and flow fields a tile edit could have made wrong"""
+        blocked = change.new_kind in BLOCKING_TILES
+        if blocked == (change.old_kind in BLOCKING_TILES):
+            return  # Still just as walkable
+            
+        grid_pos = change.grid_pos
+        self.area_goals.pop((grid_pos[0] // FLOW_FIELD_AREA_SIZE, grid_pos[1] // FLOW_FIELD_AREA_SIZE), None)
+        for key, path in list(self.paths.items()):
+            start, goal = key
+            if path is None:
+                stale = not blocked  # Might be reachable now
+            elif blocked:
+                stale = grid_pos in path
+            else:
+                # A way through the opened tile is only shorter if even a straight run through it would be
+                stale = distance(start, grid_pos) + distance(grid_pos, goal) < len(path)
+            if stale:
+                del self.paths[key]
+                
+        # Fields only cover tiles within their radius, plus the ring just outside it
+        for goal in [goal for goal in self.fields if distance(goal, grid_pos) <= FLOW_FIELD_RADIUS + 1]:
+            del self.fields[goal]
@@ -54,6 +54,7 @@ class Player(pygame.sprite.Sprite):
         self.image = self.idle_frames[self.facing][self.frame_index]
         self.rect = self.image.get_rect(center=pos)
         self.hitbox = self.rect.inflate(-20, -20)
+        self.bounds = pygame.Rect(0, 0, TILE_SIZE * MAP_WIDTH, TILE_SIZE * MAP_HEIGHT)  # Edges of the current map
         
         # Attributes (Restored for UI compatibility)
         self.speed = 3
@@ -113,7 +114,7 @@ class Player(pygame.sprite.Sprite):
         # Animate!
         self.animate(dt)
         
-        self.rect.clamp_ip(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.rect.clamp_ip(self.bounds)
 
         # Energy regeneration
         if self.energy < self.max_energy:
@@ -1,6 +1,7 @@
 # plot_system.py
 import pygame
 from settings import *
+from fonts import get_font, render_text
 
 class PlotSystem:
     """Manages farmable plot claiming, selling, and locking"""
@@ -10,8 +11,8 @@ class PlotSystem:
         self.locked_plots = set()  # Set of locked plots that can't be sold
         self.claim_cost = 50  # Cost to claim a plot
         self.sell_value = int(self.claim_cost * 0.8)  # 80% refund
-        self.font = pygame.font.Font(None, 18)
-        self.small_font = pygame.font.Font(None, 14)
+        self.font = get_font(18)
+        self.small_font = get_font(14)
         
     def is_claimed(self, grid_pos):
         """Check if a plot is claimed"""
@@ -27,12 +28,8 @@ class PlotSystem:
         if player.current_tool != "hoe":
             return False
             
-        tile = world.tile_map.get(grid_pos)
-        if not tile:
-            return False
-        
         # Only grass tiles can be claimed
-        return tile.kind == "G" and grid_pos not in self.claimed_plots
+        return world.get_kind(grid_pos) == "G" and grid_pos not in self.claimed_plots
     
     def can_sell(self, grid_pos, world):
         """Check if a plot can be sold"""
@@ -43,14 +40,11 @@ class PlotSystem:
             return False, "Plot is locked! Unlock first (L key)"
         
         # Check if there's a crop on this plot
-        tile_pos = (grid_pos[0] * TILE_SIZE, grid_pos[1] * TILE_SIZE)
-        for crop in world.crops:
-            if crop.rect.topleft == tile_pos:
-                return False, "Remove crops first!"
+        if world.get_crop(grid_pos):
+            return False, "Remove crops first!"
         
         # Check if tile is tilled
-        tile = world.tile_map.get(grid_pos)
-        if tile and tile.kind == "S":
+        if world.get_kind(grid_pos) == "S":
             return False, "Tile is tilled! Can't sell."
         
         return True, ""
@@ -137,7 +131,7 @@ class PlotSystem:
         
         return regions
     
-    def draw_claimed_indicators(self, surface):
+    def draw_claimed_indicators(self, surface, offset=(0, 0)):
         """Draw visual indicators for claimed plots with connected outlines"""
         regions = self.get_connected_plots()
         
@@ -146,8 +140,8 @@ class PlotSystem:
             outline_color = (255, 215, 0)  # Gold
             
             for grid_x, grid_y in region:
-                x = grid_x * TILE_SIZE
-                y = grid_y * TILE_SIZE
+                x = grid_x * TILE_SIZE - offset[0]
+                y = grid_y * TILE_SIZE - offset[1]
                 
                 # Draw lock icon if plot is locked
                 if (grid_x, grid_y) in self.locked_plots:
@@ -180,75 +174,84 @@ class PlotSystem:
                     pygame.draw.line(surface, outline_color, 
                                    (x + TILE_SIZE, y), (x + TILE_SIZE, y + TILE_SIZE), 2)
     
-    def draw_claimable_hint(self, surface, mouse_pos, world, player):
-        """Draw hint when hovering over claimable plot - ONLY when hoe is equipped"""
-        grid_x = mouse_pos[0] // TILE_SIZE
-        grid_y = mouse_pos[1] // TILE_SIZE
-        grid_pos = (grid_x, grid_y)
-        
-        x = grid_x * TILE_SIZE
-        y = grid_y * TILE_SIZE
-        
+    def get_hint(self, grid_pos, world, player):
+        """Get (highlight color, text, text color, text offset) for the hovered plot, or None"""
         # Check if plot is claimed and can be sold
         if grid_pos in self.claimed_plots:
             can_sell, sell_message = self.can_sell(grid_pos, world)
             is_locked = grid_pos in self.locked_plots
             
-            # Draw highlight
-            highlight = pygame.Surface((TILE_SIZE, TILE_SIZE))
-            highlight.set_alpha(80)
             if is_locked:
-                highlight.fill((255, 165, 0))  # Orange for locked
+                highlight_color = (255, 165, 0)  # Orange for locked
             elif can_sell:
-                highlight.fill((255, 100, 100))  # Red for sellable
+                highlight_color = (255, 100, 100)  # Red for sellable
             else:
-                highlight.fill((150, 150, 150))  # Gray for not sellable
-            surface.blit(highlight, (x, y))
-            
-            # Draw prompt
+                highlight_color = (150, 150, 150)  # Gray for not sellable
+                
             if can_sell:
-                text = self.font.render(f"Right-click: Sell (+${self.sell_value}) | L: Lock", True, WHITE)
+                return highlight_color, f"Right-click: Sell (+${self.sell_value}) | L: Lock", WHITE, 25
             elif is_locked:
-                text = self.font.render(f"L: Unlock plot", True, WHITE)
-            else:
-                text = self.font.render(sell_message, True, RED)
-            
-            # Position above tile
-            text_x = x + TILE_SIZE // 2 - text.get_width() // 2
-            text_y = y - 25
-            
-            # Background
-            bg = pygame.Surface((text.get_width() + 8, text.get_height() + 4))
-            bg.set_alpha(200)
-            bg.fill((40, 40, 40))
-            surface.blit(bg, (text_x - 4, text_y - 2))
-            
-            surface.blit(text, (text_x, text_y))
+                return highlight_color, f"L: Unlock plot", WHITE, 25
+            return highlight_color, sell_message, RED, 25
             
         # Check if plot can be claimed (only when hoe equipped)
         elif player.current_tool == "hoe" and self.can_claim(grid_pos, world, player):
-            # Draw highlight
-            highlight = pygame.Surface((TILE_SIZE, TILE_SIZE))
-            highlight.set_alpha(80)
-            highlight.fill((255, 255, 100))
-            surface.blit(highlight, (x, y))
-            
-            # Draw claim prompt
             can_afford = player.money >= self.claim_cost
             color = WHITE if can_afford else RED
-            text = self.font.render(f"Right-click: Claim (${self.claim_cost})", True, color)
+            return (255, 255, 100), f"Right-click: Claim (${self.claim_cost})", color, 20
             
-            # Position above tile
-            text_x = x + TILE_SIZE // 2 - text.get_width() // 2
-            text_y = y - 20
-            
-            # Background
-            bg = pygame.Surface((text.get_width() + 8, text.get_height() + 4))
-            bg.set_alpha(200)
-            bg.fill((40, 40, 40))
-            surface.blit(bg, (text_x - 4, text_y - 2))
+        return None
+        
+    def get_hint_rect(self, mouse_pos, world, player):
+        """Get the rect covered by the hover hint, or None if there is no hint"""
+        grid_pos = (mouse_pos[0] // TILE_SIZE, mouse_pos[1] // TILE_SIZE)
+        hint = self.get_hint(grid_pos, world, player)
+        if not hint:
+            return None
             
-            surface.blit(text, (text_x, text_y))
+        x = grid_pos[0] * TILE_SIZE
+        y = grid_pos[1] * TILE_SIZE
+        text_width, text_height = self.font.size(hint[1])
+        text_x = x + TILE_SIZE // 2 - text_width // 2
+        text_y = y - hint[3]
+        
+        rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
+        return rect.union(pygame.Rect(text_x - 4, text_y - 2, text_width + 8, text_height + 4))
+        
+    def draw_claimable_hint(self, surface, mouse_pos, world, player, offset=(0, 0)):
+        """Draw hint when hovering over claimable plot - ONLY when hoe is equipped"""
+        grid_x = mouse_pos[0] // TILE_SIZE
+        grid_y = mouse_pos[1] // TILE_SIZE
+        grid_pos = (grid_x, grid_y)
+        
+        x = grid_x * TILE_SIZE - offset[0]
+        y = grid_y * TILE_SIZE - offset[1]
+        
+        hint = self.get_hint(grid_pos, world, player)
+        if not hint:
+            return
+        highlight_color, message, text_color, text_offset = hint
+        
+        # Draw highlight
+        highlight = pygame.Surface((TILE_SIZE, TILE_SIZE))
+        highlight.set_alpha(80)
+        highlight.fill(highlight_color)
+        surface.blit(highlight, (x, y))
+        
+        # Draw prompt
+        text = render_text(self.font, message, True, text_color)
+        
+        # Position above tile
+        text_x = x + TILE_SIZE // 2 - text.get_width() // 2
+        text_y = y - text_offset
+        
+        # Background
+        bg = pygame.Surface((text.get_width() + 8, text.get_height() + 4))
+        bg.set_alpha(200)
+        bg.fill((40, 40, 40))
+        surface.blit(bg, (text_x - 4, text_y - 2))
+        
+        surface.blit(text, (text_x, text_y))
     
     def save_data(self):
         """Return data for saving"""
@@ -1,5 +1,6 @@
 import pygame
 from settings import *
+from fonts import get_font, render_text
 
 class Quest:
     """Individual quest with objectives and rewards"""
@@ -50,9 +51,9 @@ class QuestSystem:
         self.selected_quest = None
         
         # Fonts
-        self.font = pygame.font.Font(None, 20)
-        self.title_font = pygame.font.Font(None, 28)
-        self.small_font = pygame.font.Font(None, 16)
+        self.font = get_font(20)
+        self.title_font = get_font(28)
+        self.small_font = get_font(16)
         
         # Initialize quests
         self.init_quests()
@@ -322,11 +323,11 @@ class QuestSystem:
                            (notif_x, notif_y, notif_width, notif_height), 3)
             
             # Title
-            title = self.title_font.render("Quest Complete!", True, (255, 255, 100))
+            title = render_text(self.title_font, "Quest Complete!", True, (255, 255, 100))
             surface.blit(title, (notif_x + 20, notif_y + 15))
             
             # Quest name
-            name = self.font.render(quest.title, True, WHITE)
+            name = render_text(self.font, quest.title, True, WHITE)
             surface.blit(name, (notif_x + 20, notif_y + 45))
     
     def draw_quest_tab(self, surface, screen_width, screen_height):
@@ -354,15 +355,15 @@ class QuestSystem:
                         (panel_x, panel_y, panel_width, panel_height), 3)
         
         # Title
-        title = self.title_font.render("Quest Log", True, (255, 215, 0))
+        title = render_text(self.title_font, "Quest Log", True, (255, 215, 0))
         surface.blit(title, (panel_x + 20, panel_y + 15))
         
         # Close hint
-        close_text = self.font.render("Press Q to close", True, GRAY)
+        close_text = render_text(self.font, "Press Q to close", True, GRAY)
         surface.blit(close_text, (panel_x + panel_width - 150, panel_y + 15))
         
         # Stats
-        stats_text = self.small_font.render(
+        stats_text = render_text(self.small_font,
             f"Active: {len(self.active_quests)} | Completed: {len(self.completed_quests)}",
             True, WHITE
         )
@@ -378,7 +379,7 @@ class QuestSystem:
         list_x = panel_x + 20
         list_y = panel_y + 70
         
-        list_label = self.font.render("Active Quests", True, YELLOW)
+        list_label = render_text(self.font, "Active Quests", True, YELLOW)
         surface.blit(list_label, (list_x, list_y))
         
         # Draw quest items
@@ -397,16 +398,16 @@ class QuestSystem:
             pygame.draw.rect(surface, YELLOW if is_selected else GRAY, quest_rect, 2)
             
             # Quest title
-            title_text = self.font.render(quest.title, True, WHITE)
+            title_text = render_text(self.font, quest.title, True, WHITE)
             surface.blit(title_text, (quest_rect.x + 10, quest_rect.y + 8))
             
             # Completion status
             if quest.completed:
-                status = self.small_font.render("✓ Complete!", True, (100, 255, 100))
+                status = render_text(self.small_font, "✓ Complete!", True, (100, 255, 100))
             else:
                 completed = sum(1 for obj in quest.objectives if obj["current"] >= obj["amount"])
                 total = len(quest.objectives)
-                status = self.small_font.render(
+                status = render_text(self.small_font,
                     f"Progress: {completed}/{total}",
                     True, GRAY
                 )
@@ -416,7 +417,7 @@ class QuestSystem:
         
         # No active quests message
         if not self.active_quests:
-            no_quests = self.font.render("No active quests", True, GRAY)
+            no_quests = render_text(self.font, "No active quests", True, GRAY)
             surface.blit(no_quests, (list_x + 60, list_y + 50))
         
         # Vertical divider
@@ -433,33 +434,33 @@ class QuestSystem:
             quest = self.selected_quest
             
             # Title
-            detail_title = self.title_font.render(quest.title, True, YELLOW)
+            detail_title = render_text(self.title_font, quest.title, True, YELLOW)
             surface.blit(detail_title, (detail_x, detail_y))
             
             # Description
             desc_y = detail_y + 40
-            desc_text = self.font.render(quest.description, True, WHITE)
+            desc_text = render_text(self.font, quest.description, True, WHITE)
             surface.blit(desc_text, (detail_x, desc_y))
             
             # Objectives
             obj_y = desc_y + 40
-            obj_label = self.font.render("Objectives:", True, YELLOW)
+            obj_label = render_text(self.font, "Objectives:", True, YELLOW)
             surface.blit(obj_label, (detail_x, obj_y))
             
             obj_y += 30
             for line in quest.get_progress_text():
-                obj_text = self.small_font.render(line, True, WHITE)
+                obj_text = render_text(self.small_font, line, True, WHITE)
                 surface.blit(obj_text, (detail_x + 10, obj_y))
                 obj_y += 25
             
             # Rewards
             reward_y = obj_y + 20
-            reward_label = self.font.render("Rewards:", True, YELLOW)
+            reward_label = render_text(self.font, "Rewards:", True, YELLOW)
             surface.blit(reward_label, (detail_x, reward_y))
             
             reward_y += 30
             if "money" in quest.rewards:
-                money_text = self.small_font.render(
+                money_text = render_text(self.small_font,
                     f"💰 ${quest.rewards['money']}",
                     True, (255, 215, 0)
                 )
@@ -469,7 +470,7 @@ class QuestSystem:
             if "items" in quest.rewards:
                 for item, count in quest.rewards["items"].items():
                     item_name = item.replace("_", " ").title()
-                    item_text = self.small_font.render(
+                    item_text = render_text(self.small_font,
                         f"📦 {count}x {item_name}",
                         True, WHITE
                     )
@@ -485,13 +486,13 @@ class QuestSystem:
                 pygame.draw.rect(surface, (80, 150, 80), claim_rect)
                 pygame.draw.rect(surface, (100, 255, 100), claim_rect, 3)
                 
-                claim_text = self.font.render("CLAIM", True, WHITE)
+                claim_text = render_text(self.font, "CLAIM", True, WHITE)
                 claim_x = claim_rect.centerx - claim_text.get_width() // 2
                 claim_y = claim_rect.centery - claim_text.get_height() // 2
                 surface.blit(claim_text, (claim_x, claim_y))
         else:
             # No quest selected
-            no_select = self.font.render("Select a quest to view details", True, GRAY)
+            no_select = render_text(self.font, "Select a quest to view details", True, GRAY)
             surface.blit(no_select, (detail_x, detail_y + 50))
     
     def save_data(self):
@@ -0,0 +1,93 @@
+import random
+import hashlib
+from settings import *
+
+def derive_seed(seed, name):
+    """Seed of a named stream - the same world seed and name always give the same stream"""
+    digest = hashlib.blake2b(f"{seed}/{name}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+class RandomStream:
+    """Random numbers for one subsystem or entity, handed out from blocks generated RANDOM_BLOCK_SIZE at a time"""
+    
+    def __init__(self, seed):
+        self.seed = seed
+        self.generator = random.Random(seed)  # Seeded once - every block comes from the same generator
+        self.fill()
+        
+    def fill(self):
+        """Generate the next block of numbers"""
+        generate = self.generator.random
+        self.numbers = iter([generate() for _ in range(RANDOM_BLOCK_SIZE)])  # The block's numbers still to come
+        
+    def random(self):
+        """Next number in [0, 1)"""
+        # Looping over the block hands out its next number without a method call - it only falls through when it's used up
+        for value in self.numbers:
+            return value
+        self.fill()
+        return next(self.numbers)
+        
+    def uniform(self, a, b):
+        """Number between a and b"""
+        for value in self.numbers:
+            return a + (b - a) * value
+        self.fill()
+        return a + (b - a) * next(self.numbers)
+        
+    def randint(self, a, b):
+        """Whole number from a to b inclusive"""
+        return a + int(self.random() * (b - a + 1))
+        
+    def choice(self, sequence):
+        """Random element of a sequence"""
+        return sequence[int(self.random() * len(sequence))]
+        
+    def save_data(self):
+        """Return data for saving"""
+        rest = list(self.numbers)
+        self.numbers = iter(rest)
+        version, internal, gauss = self.generator.getstate()
+        return [self.seed, [version, list(internal), gauss], rest]
+        
+    @classmethod
+    def from_data(cls, data):
+        """Recreate a stream from its save data, continuing where it left off"""
+        stream = cls(data[0])
+        version, internal, gauss = data[1]
+        stream.generator.setstate((version, tuple(internal), gauss))
+        stream.numbers = iter(data[2])  # What was left of the block when it was saved
+        return stream
+
+class RandomStreams:
+    """Hands out independent streams per subsystem and entity, all derived from one world seed"""
+    
+    def __init__(self, seed=None):
+        self.reset(seed)
+        
+    def reset(self, seed=None):
+        """Start over from a world seed (None picks a new one)"""
+        self.seed = random.getrandbits(63) if seed is None else seed
+        self.counts = {}  # Streams created so far of each kind, so each entity gets its own
+        
+    def get(self, name):
+        """Get a fresh stream for a subsystem - the same name always gives the same numbers"""
+        return RandomStream(derive_seed(self.seed, name))
+        
+    def create(self, kind):
+        """Get a stream for a new entity of a kind, e.g. the fifth "animal" gets stream "animal/4\""""
+        number = self.counts.get(kind, 0)
+        self.counts[kind] = number + 1
+        return self.get(f"{kind}/{number}")
+        
+    def save_data(self):
+        """Return data for saving"""
+        return {"seed": self.seed, "counts": self.counts}
+        
+    def load_data(self, data):
+        """Load saved data"""
+        self.seed = data["seed"]
+        self.counts = dict(data["counts"])
+
+# Every stream in the game, reseeded from the world seed when a game starts or loads
+streams = RandomStreams()
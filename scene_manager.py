@@ -0,0 +1,219 @@
+import pygame
+import os
+import threading
+import time
+from collections import OrderedDict
+from settings import *
+from world import World
+from camera import Camera
+from map_format import MapData, pack_rows, load_object_layer
+from sprite_cache import get_shared_image
+
+class Door:
+    """A doorway tile that leads to a spot in another scene"""
+    
+    def __init__(self, grid_pos, target, target_pos, building_size=None):
+        self.rect = pygame.Rect(grid_pos[0] * TILE_SIZE, grid_pos[1] * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+        self.target = target  # Name of the scene behind the door
+        self.target_pos = target_pos  # Grid position the player arrives at
+        
+        # Front of the building the door is in, in tiles with the door at the bottom middle (None = a bare doorway)
+        self.building_rect = None
+        if building_size:
+            width, height = building_size
+            self.building_rect = pygame.Rect((grid_pos[0] - width // 2) * TILE_SIZE, (grid_pos[1] - height + 1) * TILE_SIZE,
+                                             width * TILE_SIZE, height * TILE_SIZE)
+                                             
+        # Drawn once and blitted, so redrawing a dirty rect that cuts through it leaves no stray outline edges
+        self.image = get_shared_image(("door", building_size), self.create_image)
+        
+    @property
+    def bounds(self):
+        """Rect covering everything the door draws"""
+        return self.building_rect or self.rect
+        
+    @property
+    def target_center(self):
+        """Pixel position the player arrives at"""
+        return (self.target_pos[0] * TILE_SIZE + TILE_SIZE // 2, self.target_pos[1] * TILE_SIZE + TILE_SIZE // 2)
+        
+    def create_image(self):
+        """Draw the door, in front of its building if it has one, onto an image covering its bounds"""
+        image = pygame.Surface(self.bounds.size, pygame.SRCALPHA)
+        if self.building_rect:
+            self.draw_building(image, image.get_rect())
+        rect = self.rect.move(-self.bounds.left, -self.bounds.top)
+        pygame.draw.rect(image, BROWN, rect.inflate(-8, -4))
+        pygame.draw.rect(image, (100, 50, 10), rect.inflate(-8, -4), 2)
+        pygame.draw.circle(image, YELLOW, (rect.right - 10, rect.centery + 2), 2)
+        return image
+        
+    def draw(self, surface, offset=(0, 0)):
+        """Draw the door, in front of its building if it has one"""
+        surface.blit(self.image, (self.bounds.left - offset[0], self.bounds.top - offset[1]))
+        
+    def draw_building(self, surface, building):
+        """Draw the walls, roof and windows of the door's building"""
+        walls = pygame.Rect(building.left, building.top + TILE_SIZE, building.width, building.height - TILE_SIZE)
+        pygame.draw.rect(surface, LIGHT_BROWN, walls)
+        pygame.draw.rect(surface, (100, 50, 10), walls, 2)
+        pygame.draw.polygon(surface, RED, [walls.topleft, (building.centerx, building.top + 4), walls.topright])
+        pygame.draw.polygon(surface, (120, 30, 30), [walls.topleft, (building.centerx, building.top + 4), walls.topright], 2)
+        
+        # A window either side of the door
+        for window_x in (walls.left + TILE_SIZE // 2, walls.right - TILE_SIZE // 2):
+            window = pygame.Rect(0, 0, 12, 12)
+            window.center = (window_x, walls.top + TILE_SIZE // 2)
+            pygame.draw.rect(surface, BLUE, window)
+            pygame.draw.rect(surface, (100, 50, 10), window, 2)
+
+class Scene:
+    """A map the player can be in, with the doors leading out of it"""
+    
+    def __init__(self, name, map_file=None, size=(MAP_WIDTH, MAP_HEIGHT), layout=None, spawn=None,
+                 doors=(), plots=False, objects_file=None):
+        self.name = name
+        self.map_file = map_file  # Text or binary map, None for the default farm layout
+        self.objects_file = objects_file  # Text object layer placed over the map, if any
+        self.size = size  # Map size in tiles when there is no map file
+        self.layout = layout  # Builds the map rows when the map file is missing or empty
+        self.spawn = spawn or (size[0] // 2, size[1] // 2)
+        self.doors = list(doors)
+        self.plots = plots  # Whether farm plots can be claimed here
+        
+    def create_world(self, view_size, data=None, clock=time.time):
+        """Load the scene's world (and its saved changes) and bake the terrain around its spawn point"""
+        world = World(clock)
+        if self.map_file and os.path.exists(self.map_file) and os.path.getsize(self.map_file):
+            world.load(self.map_file, self.objects_file)
+        elif self.layout:
+            width, height = self.size
+            world.reset(width, height, MapData(width, height, pack_rows(self.layout(width, height), width),
+                                               load_object_layer(self.objects_file, width, height)))
+        else:
+            world.create_default_map(self.objects_file)
+        if data:
+            world.load_data(data)
+            
+        camera = Camera(world.width * TILE_SIZE, world.height * TILE_SIZE, *view_size)
+        camera.follow(pygame.Rect(self.spawn[0] * TILE_SIZE, self.spawn[1] * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+        world.load_chunks_near(camera.rect)
+        for chunk in world.get_chunks_in_area(camera.rect):
+            chunk.bake()
+        return world
+        
+    def draw_doors(self, surface, area, offset=(0, 0)):
+        """Draw the doors inside a world-space area"""
+        for door in self.doors:
+            if door.bounds.colliderect(area):
+                door.draw(surface, offset)
+
+def create_room_layout(width, height):
+    """Rows of a plain room - floor surrounded by walls"""
+    wall = "F" * width
+    return [wall] + ["F" + "P" * (width - 2) + "F"] * (height - 2) + [wall]
+
+def create_scenes():
+    """The farm and the buildings on it"""
+    house_size = (12, 9)
+    house_door = (house_size[0] // 2, house_size[1] - 1)
+    house_spawn = (house_door[0], house_door[1] - 1)
+    farm_door = (22, 12)  # Well away from the shopkeeper and mayor, so trading doesn't walk the player indoors
+    farm_spawn = (farm_door[0], farm_door[1] + 1)
+    return [
+        Scene(FARM_SCENE, doors=[Door(farm_door, HOUSE_SCENE, house_spawn, building_size=(3, 3))], plots=True,
+              objects_file="objects.txt"),
+        Scene(HOUSE_SCENE, "house_map.txt", house_size, create_room_layout, spawn=house_spawn,
+              doors=[Door(house_door, FARM_SCENE, farm_spawn)]),
+    ]
+
+class SceneManager:
+    """Holds the scenes' worlds, keeping recently used ones warm and preloading the next"""
+    
+    def __init__(self, scenes, view_size, world_clock=time.time):
+        self.scenes = {scene.name: scene for scene in scenes}
+        self.view_size = view_size
+        self.world_clock = world_clock  # Handed to every world, for crop growth
+        self.worlds = OrderedDict()  # Loaded worlds by scene name, least recently used first
+        self.loading = {}  # Background preload threads by scene name
+        self.saved_worlds = {}  # Save data of worlds not loaded right now
+        self.lock = threading.Lock()
+        self.current = None
+        
+    def preload(self, name):
+        """Start loading a scene in the background if it is not warm already"""
+        with self.lock:
+            if name in self.worlds or name in self.loading:
+                return
+            thread = threading.Thread(target=self.load_world, args=(name,), daemon=True)
+            self.loading[name] = thread
+        thread.start()
+        
+    def load_world(self, name):
+        """Build a scene's world and add it to the warm ones"""
+        with self.lock:
+            data = self.saved_worlds.pop(name, None)
+        world = self.scenes[name].create_world(self.view_size, data, self.world_clock)
+        with self.lock:
+            self.worlds[name] = world
+            self.loading.pop(name, None)
+            
+    def get_world(self, name):
+        """Get a scene's world, waiting for its preload or loading it now"""
+        with self.lock:
+            thread = self.loading.get(name)
+        if thread:
+            thread.join()
+        if name not in self.worlds:
+            self.load_world(name)
+            
+        with self.lock:
+            self.worlds.move_to_end(name)
+            while len(self.worlds) > SCENE_CACHE_SIZE:
+                evicted, world = self.worlds.popitem(last=False)
+                self.saved_worlds[evicted] = world.save_data()
+            return self.worlds[name]
+            
+    def switch(self, name):
+        """Make a scene the current one"""
+        world = self.get_world(name)
+        self.current = self.scenes[name]
+        return self.current, world
+        
+    def save_data(self):
+        """Return data for saving - the changes made to every scene"""
+        self.wait_for_preloads()
+        data = dict(self.saved_worlds)
+        for name, world in self.worlds.items():
+            data[name] = world.save_data()
+        return data
+        
+    def load_data(self, data):
+        """Load saved data into loaded worlds now and the others when they are next loaded"""
+        self.wait_for_preloads()
+        for name, world_data in data.items():
+            if name in self.worlds:
+                self.worlds[name].load_data(world_data)
+            elif name in self.scenes:
+                self.saved_worlds[name] = world_data
+                
+    def wait_for_preloads(self):
+        """Let background loads finish so no world is missed"""
+        with self.lock:
+            threads = list(self.loading.values())
+        for thread in threads:
+            thread.join()
+            
+    def find_door(self, rect):
+        """Get the door of the current scene a rect is standing in, if any"""
+        for door in self.current.doors:
+            if door.rect.collidepoint(rect.center):
+                return door
+        return None
+        
+    def preload_near(self, rect):
+        """Preload the scenes behind doors close to a rect"""
+        reach = SCENE_PRELOAD_DISTANCE * TILE_SIZE * 2
+        for door in self.current.doors:
+            if door.rect.inflate(reach, reach).colliderect(rect):
+                self.preload(door.target)
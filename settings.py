@@ -2,11 +2,13 @@
 TILE_SIZE = 32
 MAP_WIDTH = 30
 MAP_HEIGHT = 17
-DEFAULT_SCREEN_WIDTH = TILE_SIZE * MAP_WIDTH
-DEFAULT_SCREEN_HEIGHT = TILE_SIZE * MAP_HEIGHT
+VIEW_WIDTH = 30  # Tiles shown at once - the camera scrolls over bigger maps
+VIEW_HEIGHT = 17
+DEFAULT_SCREEN_WIDTH = TILE_SIZE * VIEW_WIDTH
+DEFAULT_SCREEN_HEIGHT = TILE_SIZE * VIEW_HEIGHT
 MIN_SCREEN_WIDTH = 800
 MIN_SCREEN_HEIGHT = 600
-FPS = 60
+FPS = 60  # Most frames drawn per second - game speed doesn't depend on it
 
 # Dynamic screen size (will be updated by game)
 SCREEN_WIDTH = DEFAULT_SCREEN_WIDTH
@@ -29,11 +31,56 @@ INITIAL_SEEDS = 10
 INITIAL_MONEY = 100
 CROP_SELL_MULTIPLIER = 2
 
+# World Streaming
+CHUNK_SIZE = 16  # Tiles per side of a chunk - the unit the map is loaded, saved and baked in
+CHUNK_CACHE_SIZE = 36  # Chunks kept in memory before the least recently used are evicted
+CHUNK_LOAD_MARGIN = 1  # Chunks beyond the camera view to load ahead of time
+
+# Scenes
+FARM_SCENE = "farm"
+HOUSE_SCENE = "house"
+SCENE_CACHE_SIZE = 3  # Scenes kept loaded (chunks and baked terrain) after the player leaves them
+SCENE_PRELOAD_DISTANCE = 3  # Tiles from a door at which the scene behind it starts loading
+
+# Entities
+SPATIAL_CELL_SIZE = TILE_SIZE * 2  # Cell size of the grid used to find nearby animals and NPCs
+ANIMAL_LOD_MARGIN = TILE_SIZE * 4  # Animals this far outside the view still update every step
+ANIMAL_FAR_INTERVAL = 8  # Steps between updates of animals further away
+VECTORIZED_ANIMALS = False  # Update animals in NumPy batches (needs numpy) - pays off for very large herds
+
+# Randomness
+WORLD_SEED = None  # Seed every random stream is derived from - None picks a new one each game
+RANDOM_BLOCK_SIZE = 64  # Random numbers a stream generates at a time
+
+# Pathfinding
+BLOCKING_TILES = "WFTR"  # Water, fences, trees and rocks can't be walked through
+PATH_CACHE_SIZE = 256  # A* paths kept before the least recently used are dropped
+PATH_SEARCH_LIMIT = 4096  # Most tiles one A* search expands before giving up
+FLOW_FIELD_RADIUS = 32  # Steps from its goal a flow field reaches
+FLOW_FIELD_CACHE_SIZE = 16  # Flow fields kept before the least recently used are dropped
+FLOW_FIELD_AREA_SIZE = 8  # Tiles across the areas whose agents share one flow field toward the area's middle
+
+# Crops
+VECTORIZED_CROPS = False  # Grow crops with the NumPy batch engine (needs numpy) - pays off for very large fields
+
+# Rendering
+DIRTY_RECT_RENDERING = True  # Only redraw and push the parts of the screen that changed
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept for reuse
+ICON_SIZE = 28  # Item icons are pre-rendered into square cells this big
+ICON_CACHE_FILE = None  # Set to a .png path to keep the item icon atlas between runs
+TERRAIN_CACHE_MAX_PIXELS = 4096 * 4096  # Bigger maps draw visible tiles directly instead of baking
+
 # Time Settings
 TIME_SPEED = 0.001  # How fast time passes
 NIGHT_START = 18
 NIGHT_END = 6
 
+# Simulation
+SIM_STEP = 1 / 60  # Seconds per fixed simulation step - per-step timers and speeds are tuned to this
+MAX_SIM_STEPS = 5  # Most steps run in one frame to catch up - any backlog beyond that is dropped
+TIMER_WHEEL_SLOT_BITS = 6  # 64 slots per timer wheel level
+TIMER_WHEEL_LEVELS = 4  # Four levels reach 64^4 steps (about 77 hours) before deadlines overflow
+
 def update_screen_size(width, height):
     """Update global screen size variables"""
     global SCREEN_WIDTH, SCREEN_HEIGHT
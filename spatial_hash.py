@@ -0,0 +1,84 @@
+from itertools import count
+from settings import *
+
+class SpatialHash:
+    """Uniform grid of entities by the cell their centre is in, for proximity and area queries"""
+    
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> {entity: None}, dicts keep results in a stable order
+        self.entities = {}  # entity -> (cell, insertion order)
+        self.order = count()
+        
+    def __len__(self):
+        return len(self.entities)
+        
+    def get_cell(self, pos):
+        """Get the cell a pixel position falls in"""
+        return (int(pos[0]) // self.cell_size, int(pos[1]) // self.cell_size)
+        
+    def insert(self, entity):
+        """Add an entity at its current position"""
+        cell = self.get_cell(entity.rect.center)
+        self.cells.setdefault(cell, {})[entity] = None
+        self.entities[entity] = (cell, next(self.order))
+        
+    def remove(self, entity):
+        """Take an entity out of the grid"""
+        cell, _ = self.entities.pop(entity)
+        bucket = self.cells[cell]
+        del bucket[entity]
+        if not bucket:
+            del self.cells[cell]
+            
+    def move(self, entity):
+        """Re-file an entity after it moved - nothing to do unless it crossed into another cell"""
+        rect = entity.rect
+        cell = (rect.centerx // self.cell_size, rect.centery // self.cell_size)
+        old_cell, order = self.entities[entity]
+        if cell != old_cell:
+            bucket = self.cells[old_cell]
+            del bucket[entity]
+            if not bucket:
+                del self.cells[old_cell]
+            self.cells.setdefault(cell, {})[entity] = None
+            self.entities[entity] = (cell, order)
+            
+    def rebuild(self, entities):
+        """Replace the contents with a new set of entities"""
+        self.cells.clear()
+        self.entities.clear()
+        for entity in entities:
+            self.insert(entity)
+            
+    def get_cells_in_area(self, left, top, right, bottom):
+        """Get the non-empty cells overlapping a pixel area"""
+        left_cell, top_cell = self.get_cell((left, top))
+        right_cell, bottom_cell = self.get_cell((right, bottom))
+        for cell_y in range(top_cell, bottom_cell + 1):
+            for cell_x in range(left_cell, right_cell + 1):
+                bucket = self.cells.get((cell_x, cell_y))
+                if bucket:
+                    yield bucket
+                    
+    def query_rect(self, rect):
+        """Get the entities whose centre is inside a pixel rect, in the order they were added"""
+        found = [entity for bucket in self.get_cells_in_area(rect.left, rect.top, rect.right - 1, rect.bottom - 1)
+                 for entity in bucket if rect.collidepoint(entity.rect.center)]
+        found.sort(key=lambda entity: self.entities[entity][1])
+        return found
+        
+    def nearest(self, pos, radius):
+        """Get the entity closest to a position within a radius, or None"""
+        x, y = pos
+        nearest = None
+        nearest_distance = radius * radius
+        for bucket in self.get_cells_in_area(x - radius, y - radius, x + radius, y + radius):
+            for entity in bucket:
+                dx = entity.rect.centerx - x
+                dy = entity.rect.centery - y
+                distance = dx * dx + dy * dy
+                if distance <= nearest_distance:
+                    nearest = entity
+                    nearest_distance = distance
+        return nearest
@@ -0,0 +1,11 @@
+# Images shared by every sprite of the same type, keyed by e.g. ("tile", kind).
+# Many sprites draw the same surface, so shared images must never be drawn on.
+shared_images = {}
+
+def get_shared_image(key, create):
+    """Get the image cached under key, calling create() to build it the first time"""
+    image = shared_images.get(key)
+    if image is None:
+        image = create()
+        shared_images[key] = image
+    return image
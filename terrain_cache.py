@@ -0,0 +1,47 @@
+import pygame
+from settings import *
+
+class TerrainCache:
+    """All tiles composited into one surface, patched when a single tile changes"""
+    
+    def __init__(self, tiles):
+        self.tiles = tiles
+        self.surface = None
+        self.rebuild()
+        
+    def rebuild(self):
+        """Composite every tile into a fresh terrain surface"""
+        width, height = self.tiles.width, self.tiles.height
+        
+        # Huge maps would need a huge surface - draw their visible tiles directly instead
+        if width * height * TILE_SIZE * TILE_SIZE > TERRAIN_CACHE_MAX_PIXELS:
+            self.surface = None
+            return
+            
+        self.surface = pygame.Surface((width * TILE_SIZE, height * TILE_SIZE))
+        self.surface.fill(BLACK)
+        for grid_y in range(height):
+            for grid_x in range(width):
+                self.update_tile((grid_x, grid_y))
+            
+    def update_tile(self, grid_pos):
+        """Repaint a single tile after it changed"""
+        image = self.tiles.get_image(grid_pos)
+        if image and self.surface:
+            self.surface.blit(image, (grid_pos[0] * TILE_SIZE, grid_pos[1] * TILE_SIZE))
+            
+    def draw(self, surface, area=None, offset=(0, 0)):
+        """Blit the terrain, optionally only the part inside a world-space area"""
+        if area is None:
+            area = surface.get_rect(topleft=offset)
+            
+        if self.surface:
+            surface.blit(self.surface, (area.x - offset[0], area.y - offset[1]), area)
+            return
+            
+        # Only the tiles overlapping the area
+        for grid_y in range(area.top // TILE_SIZE, (area.bottom - 1) // TILE_SIZE + 1):
+            for grid_x in range(area.left // TILE_SIZE, (area.right - 1) // TILE_SIZE + 1):
+                image = self.tiles.get_image((grid_x, grid_y))
+                if image:
+                    surface.blit(image, (grid_x * TILE_SIZE - offset[0], grid_y * TILE_SIZE - offset[1]))
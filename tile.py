@@ -1,99 +1,167 @@
 import pygame
+from array import array
+from collections import namedtuple
 from settings import *
+from sprite_cache import get_shared_image
 
-class Tile(pygame.sprite.Sprite):
-    def __init__(self, pos, kind):
-        super().__init__()
-        self.kind = kind
-        self.farmable = False
-        self.watered = False
+# Tile state flags, packed into one byte per cell
+FARMABLE = 1
+TILLED = 2
+WATERED = 4
+
+# Flags every kind of tile starts with, indexed by its map character code
+INITIAL_FLAGS = bytearray(256)
+INITIAL_FLAGS[ord("G")] = FARMABLE
+INITIAL_FLAGS[ord("S")] = FARMABLE | TILLED
+INITIAL_FLAGS = bytes(INITIAL_FLAGS)
+
+# Snapshot of one cell, handed out instead of keeping an object per tile
+TileInfo = namedtuple("TileInfo", ["kind", "farmable", "tilled", "watered"])
+
+def create_tile_image(kind):
+    """Create tile graphics for a kind of tile"""
+    image = pygame.Surface((TILE_SIZE, TILE_SIZE))
+    
+    if kind == "G":  # Grass
+        image.fill(GREEN)
+        # Add texture
+        for _ in range(8):
+            x = pygame.Rect(
+                pygame.math.Vector2(
+                    pygame.math.Vector2(0, 0).x + (TILE_SIZE // 8) * (_ % 4),
+                    pygame.math.Vector2(0, 0).y + (TILE_SIZE // 4) * (_ // 4)
+                ),
+                (2, 4)
+            )
+            pygame.draw.rect(image, DARK_GREEN, x)
+            
+    elif kind == "S":  # Soil/Tilled
+        image.fill(BROWN)
+        # Add lines for tilled look
+        for i in range(4):
+            pygame.draw.line(image, (100, 50, 10), 
+                           (0, i * 8), (TILE_SIZE, i * 8), 1)
+                           
+    elif kind == "W":  # Water
+        image.fill(BLUE)
+        # Add wave effect
+        pygame.draw.circle(image, (100, 180, 255), (8, 8), 4)
+        pygame.draw.circle(image, (100, 180, 255), (24, 20), 3)
         
-        # Create tile graphics
-        self.image = pygame.Surface((TILE_SIZE, TILE_SIZE))
+    elif kind == "P":  # Path
+        image.fill(LIGHT_BROWN)
+        # Add stones
+        pygame.draw.circle(image, GRAY, (8, 8), 2)
+        pygame.draw.circle(image, GRAY, (24, 20), 2)
+        pygame.draw.circle(image, GRAY, (16, 24), 2)
         
-        if kind == "G":  # Grass
-            self.image.fill(GREEN)
-            self.farmable = True
-            # Add texture
-            for _ in range(8):
-                x = pygame.Rect(
-                    pygame.math.Vector2(
-                        pygame.math.Vector2(0, 0).x + (TILE_SIZE // 8) * (_ % 4),
-                        pygame.math.Vector2(0, 0).y + (TILE_SIZE // 4) * (_ // 4)
-                    ),
-                    (2, 4)
-                )
-                pygame.draw.rect(self.image, DARK_GREEN, x)
-                
-        elif kind == "S":  # Soil/Tilled
-            self.image.fill(BROWN)
-            self.farmable = True
-            self.tilled = True
-            # Add lines for tilled look
-            for i in range(4):
-                pygame.draw.line(self.image, (100, 50, 10), 
-                               (0, i * 8), (TILE_SIZE, i * 8), 1)
-                               
-        elif kind == "W":  # Water
-            self.image.fill(BLUE)
-            # Add wave effect
-            pygame.draw.circle(self.image, (100, 180, 255), (8, 8), 4)
-            pygame.draw.circle(self.image, (100, 180, 255), (24, 20), 3)
-            
-        elif kind == "P":  # Path
-            self.image.fill(LIGHT_BROWN)
-            # Add stones
-            pygame.draw.circle(self.image, GRAY, (8, 8), 2)
-            pygame.draw.circle(self.image, GRAY, (24, 20), 2)
-            pygame.draw.circle(self.image, GRAY, (16, 24), 2)
-            
-        elif kind == "T":  # Tree
-            self.image.fill(GREEN)
-            # Draw tree trunk
-            pygame.draw.rect(self.image, BROWN, (12, 16, 8, 16))
-            # Draw tree canopy
-            pygame.draw.circle(self.image, DARK_GREEN, (16, 12), 10)
-            pygame.draw.circle(self.image, (50, 120, 50), (12, 10), 6)
-            pygame.draw.circle(self.image, (50, 120, 50), (20, 10), 6)
-            
-        elif kind == "R":  # Rock
-            self.image.fill(GREEN)
-            pygame.draw.polygon(self.image, GRAY, 
-                              [(16, 8), (26, 20), (16, 28), (6, 20)])
-            pygame.draw.polygon(self.image, (100, 100, 100), 
-                              [(16, 8), (26, 20), (16, 16)])
-                              
-        elif kind == "F":  # Fence
-            self.image.fill(GREEN)
-            pygame.draw.rect(self.image, BROWN, (2, 12, 28, 4))
-            pygame.draw.rect(self.image, BROWN, (2, 20, 28, 4))
-            pygame.draw.rect(self.image, BROWN, (8, 8, 4, 20))
-            pygame.draw.rect(self.image, BROWN, (20, 8, 4, 20))
-            
-        else:  # Default
-            self.image.fill(BLACK)
-            
-        self.rect = self.image.get_rect(topleft=pos)
+    elif kind == "T":  # Tree
+        image.fill(GREEN)
+        # Draw tree trunk
+        pygame.draw.rect(image, BROWN, (12, 16, 8, 16))
+        # Draw tree canopy
+        pygame.draw.circle(image, DARK_GREEN, (16, 12), 10)
+        pygame.draw.circle(image, (50, 120, 50), (12, 10), 6)
+        pygame.draw.circle(image, (50, 120, 50), (20, 10), 6)
+        
+    elif kind == "R":  # Rock
+        image.fill(GREEN)
+        pygame.draw.polygon(image, GRAY, 
+                          [(16, 8), (26, 20), (16, 28), (6, 20)])
+        pygame.draw.polygon(image, (100, 100, 100), 
+                          [(16, 8), (26, 20), (16, 16)])
+                          
+    elif kind == "F":  # Fence
+        image.fill(GREEN)
+        pygame.draw.rect(image, BROWN, (2, 12, 28, 4))
+        pygame.draw.rect(image, BROWN, (2, 20, 28, 4))
+        pygame.draw.rect(image, BROWN, (8, 8, 4, 20))
+        pygame.draw.rect(image, BROWN, (20, 8, 4, 20))
+        
+    else:  # Default
+        image.fill(BLACK)
+        
+    return image
+
+def create_watered_image():
+    """Create tile graphics for watered soil"""
+    image = pygame.Surface((TILE_SIZE, TILE_SIZE))
+    image.fill((80, 50, 20))  # Darker, wet soil
+    for i in range(4):
+        pygame.draw.line(image, (60, 40, 15), 
+                       (0, i * 8), (TILE_SIZE, i * 8), 1)
+    return image
+
+def get_tile_image(kind, watered=False):
+    """Get the shared image for a kind of tile"""
+    if watered:
+        return get_shared_image(("tile", kind, "watered"), create_watered_image)
+    return get_shared_image(("tile", kind), lambda: create_tile_image(kind))
+
+class TileStore:
+    """Kind and state of every cell in the map, one byte each instead of a sprite per tile"""
+    
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.kinds = array("B", bytes(width * height))  # Map character code, 0 = no tile
+        self.flags = array("B", bytes(width * height))  # FARMABLE | TILLED | WATERED bits
+        
+    def index(self, grid_pos):
+        """Get the array index of a grid position, or None if it is off the map"""
+        grid_x, grid_y = grid_pos
+        if 0 <= grid_x < self.width and 0 <= grid_y < self.height:
+            return grid_y * self.width + grid_x
+        return None
+        
+    def set_row(self, grid_y, row):
+        """Fill a row of the map from a string (or bytes) of tile characters"""
+        codes = row.encode("ascii") if isinstance(row, str) else row
+        codes = codes[:self.width]
+        start = grid_y * self.width
+        self.kinds[start:start + len(codes)] = array("B", codes)
+        self.flags[start:start + len(codes)] = array("B", codes.translate(INITIAL_FLAGS))
+        
+    def get_kind(self, grid_pos):
+        """Get the tile character at a grid position, or None if there is no tile"""
+        i = self.index(grid_pos)
+        if i is None or not self.kinds[i]:
+            return None
+        return chr(self.kinds[i])
+        
+    def get_cell(self, grid_pos):
+        """Get the raw (kind code, flags) bytes at a grid position"""
+        i = self.index(grid_pos)
+        return (self.kinds[i], self.flags[i])
+        
+    def get_tile(self, grid_pos):
+        """Get a TileInfo for a grid position, or None if there is no tile"""
+        kind = self.get_kind(grid_pos)
+        if kind is None:
+            return None
+        flags = self.flags[self.index(grid_pos)]
+        return TileInfo(kind, bool(flags & FARMABLE), bool(flags & TILLED), bool(flags & WATERED))
+        
+    def get_image(self, grid_pos):
+        """Get the image to draw at a grid position, or None if there is no tile"""
+        kind = self.get_kind(grid_pos)
+        if kind is None:
+            return None
+        return get_tile_image(kind, self.flags[self.index(grid_pos)] & WATERED)
         
-    def till(self):
+    def till(self, grid_pos):
         """Convert grass to tilled soil"""
-        if self.kind == "G" and not self.watered:
-            self.kind = "S"
-            self.tilled = True
-            self.image.fill(BROWN)
-            for i in range(4):
-                pygame.draw.line(self.image, (100, 50, 10), 
-                               (0, i * 8), (TILE_SIZE, i * 8), 1)
+        i = self.index(grid_pos)
+        if i is not None and self.kinds[i] == ord("G") and not self.flags[i] & WATERED:
+            self.kinds[i] = ord("S")
+            self.flags[i] |= TILLED
             return True
         return False
         
-    def water(self):
+    def water(self, grid_pos):
         """Water the tile"""
-        if self.kind == "S" and not self.watered:
-            self.watered = True
-            self.image.fill((80, 50, 20))  # Darker, wet soil
-            for i in range(4):
-                pygame.draw.line(self.image, (60, 40, 15), 
-                               (0, i * 8), (TILE_SIZE, i * 8), 1)
+        i = self.index(grid_pos)
+        if i is not None and self.kinds[i] == ord("S") and not self.flags[i] & WATERED:
+            self.flags[i] |= WATERED
             return True
         return False
\ No newline at end of file
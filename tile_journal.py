@@ -0,0 +1,36 @@
+from collections import namedtuple
+
+# One tile edit - kinds are map characters, flags the packed FARMABLE/TILLED/WATERED bits
+TileChange = namedtuple("TileChange", ["grid_pos", "old_kind", "new_kind", "old_flags", "new_flags"])
+
+class TileJournal:
+    """Record of tile changes, pushed to subscribers and queued for readers to drain"""
+    
+    def __init__(self):
+        self.subscribers = []  # Called with each change as it happens
+        self.queues = {}  # Reader name -> changes since it last drained
+        
+    def subscribe(self, callback):
+        """Call back with every future change"""
+        self.subscribers.append(callback)
+        
+    def unsubscribe(self, callback):
+        """Stop calling a subscriber"""
+        self.subscribers.remove(callback)
+        
+    def record(self, change):
+        """Publish a change"""
+        for callback in self.subscribers:
+            callback(change)
+        for queue in self.queues.values():
+            queue.append(change)
+            
+    def drain(self, reader):
+        """Return and clear the changes since a reader last drained - a reader starts on its first call"""
+        changes = self.queues.get(reader, [])
+        self.queues[reader] = []
+        return changes
+        
+    def close(self, reader):
+        """Stop queueing changes for a reader"""
+        self.queues.pop(reader, None)
@@ -0,0 +1,81 @@
+import math
+from settings import *
+
+class TimerWheel:
+    """Hierarchical timer wheel - items are handed back on the tick their deadline comes up"""
+    
+    def __init__(self, levels=TIMER_WHEEL_LEVELS, slot_bits=TIMER_WHEEL_SLOT_BITS):
+        self.now = 0  # Ticks advanced so far
+        self.slot_bits = slot_bits
+        self.slot_mask = (1 << slot_bits) - 1
+        # Level 0 holds one tick per slot, each level above a whole turn of the level below
+        self.levels = [[[] for _ in range(1 << slot_bits)] for _ in range(levels)]
+        self.overflow = []  # Deadlines past the top level, sorted in when the top level comes round
+        
+    def schedule(self, item, ticks):
+        """Hand item back after a number of ticks, replacing any timer it already had"""
+        return self.schedule_at(item, self.now + max(1, math.ceil(ticks)))
+        
+    def schedule_at(self, item, deadline):
+        """Hand item back on the tick given, replacing any timer it already had"""
+        item.timer_deadline = deadline
+        self.insert(deadline, item)
+        return deadline
+        
+    def cancel(self, item):
+        """Drop an item's timer - its entry is skipped when it comes up"""
+        item.timer_deadline = None
+        
+    def get_ticks_left(self, item):
+        """Ticks until an item's timer fires (None if it has none)"""
+        if item.timer_deadline is None:
+            return None
+        return max(0, item.timer_deadline - self.now)
+        
+    def insert(self, deadline, item):
+        """File an entry in the lowest level whose current turn reaches its deadline"""
+        for level, slots in enumerate(self.levels):
+            shift = self.slot_bits * level
+            if deadline >> (shift + self.slot_bits) == self.now >> (shift + self.slot_bits):
+                slots[(deadline >> shift) & self.slot_mask].append((deadline, item))
+                return
+        self.overflow.append((deadline, item))
+        
+    def advance(self):
+        """Move on one tick and return the items whose timers fired"""
+        self.now += 1
+        due = []
+        
+        # Entries in a higher slot whose turn has started move down a level (or fire now)
+        top_shift = self.slot_bits * len(self.levels)
+        if not self.now & ((1 << top_shift) - 1):
+            overflow, self.overflow = self.overflow, []
+            self.cascade(overflow, due)
+        for level in range(len(self.levels) - 1, 0, -1):
+            shift = self.slot_bits * level
+            if not self.now & ((1 << shift) - 1):
+                slots = self.levels[level]
+                index = (self.now >> shift) & self.slot_mask
+                entries, slots[index] = slots[index], []
+                self.cascade(entries, due)
+                
+        slots = self.levels[0]
+        index = self.now & self.slot_mask
+        due.extend(slots[index])
+        slots[index] = []
+        
+        fired = []
+        for deadline, item in due:
+            # Skip entries cancelled or rescheduled since they were filed
+            if item.timer_deadline == deadline:
+                item.timer_deadline = None
+                fired.append(item)
+        return fired
+        
+    def cascade(self, entries, due):
+        """Re-file entries from a slot whose turn has come round"""
+        for deadline, item in entries:
+            if deadline <= self.now:
+                due.append((deadline, item))
+            else:
+                self.insert(deadline, item)
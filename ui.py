@@ -1,12 +1,27 @@
 import pygame
 from settings import *
+from fonts import get_font, render_text
 
 class UI:
+    CONTROLS = [
+        "WASD/Arrows - Move",
+        "Left Click - Use Tool",
+        "Right Click - Claim/Sell",
+        "L - Lock/Unlock Plot",
+        "1-5 - Select Hotbar",
+        "T - Change Tool",
+        "E - Inventory",
+        "C - Crafting Menu",
+        "I - Toggle Grid",
+        "H - Shop Help",
+        "ESC - Save & Quit"
+    ]
+    
     def __init__(self):
-        self.font = pygame.font.Font(None, 22)
-        self.title_font = pygame.font.Font(None, 28)
-        self.small_font = pygame.font.Font(None, 18)
-        self.tiny_font = pygame.font.Font(None, 14)
+        self.font = get_font(22)
+        self.title_font = get_font(28)
+        self.small_font = get_font(18)
+        self.tiny_font = get_font(14)
         
         # Settings
         self.show_controls = False
@@ -15,6 +30,34 @@ class UI:
         """Toggle controls visibility"""
         self.show_controls = not self.show_controls
         
+    def get_stats_rect(self):
+        """Get the rect of the player stats panel"""
+        return pygame.Rect(10, 10, 250, 120)
+        
+    def get_stats_signature(self, player, time_system):
+        """Get the values shown in the stats panel, to detect when it changes"""
+        energy_width = int((player.energy / player.max_energy) * 150)
+        return (player.money, energy_width, player.energy > 30, player.current_tool,
+                time_system.get_time_string(), time_system.get_day_string())
+                
+    def get_controls_rect(self, screen_width, screen_height):
+        """Get the rect of the controls guide"""
+        return pygame.Rect(screen_width - 230, 10, 220, len(self.CONTROLS) * 22 + 30)
+        
+    def get_settings_button_rect(self, screen_width, screen_height):
+        """Get the rect of the settings button"""
+        button_size = 32
+        return pygame.Rect(screen_width - button_size - 10, screen_height - button_size - 10,
+                           button_size, button_size)
+                           
+    def get_notification_rect(self, message, screen_width, screen_height):
+        """Get the rect of a notification message"""
+        text_width, text_height = self.font.size(message)
+        padding = 20
+        width = text_width + padding * 2
+        height = text_height + padding * 2
+        return pygame.Rect((screen_width - width) // 2, screen_height - 200, width, height)
+        
     def draw_player_stats(self, surface, player, time_system):
         """Draw player stats in top-left corner"""
         # Background
@@ -29,12 +72,12 @@ class UI:
         y_offset = 20
         
         # Money
-        money_text = self.font.render(f"Money: ${player.money}", True, YELLOW)
+        money_text = render_text(self.font, f"Money: ${player.money}", True, YELLOW)
         surface.blit(money_text, (20, y_offset))
         
         # Energy bar
         y_offset += 30
-        energy_text = self.font.render(f"Energy:", True, WHITE)
+        energy_text = render_text(self.font, f"Energy:", True, WHITE)
         surface.blit(energy_text, (20, y_offset))
         
         bar_width = 150
@@ -53,7 +96,7 @@ class UI:
         
         # Current tool
         y_offset += 30
-        tool_text = self.font.render(f"Tool: {player.current_tool.replace('_', ' ').title()}", 
+        tool_text = render_text(self.font, f"Tool: {player.current_tool.replace('_', ' ').title()}", 
                                      True, WHITE)
         surface.blit(tool_text, (20, y_offset))
         
@@ -61,7 +104,7 @@ class UI:
         y_offset += 30
         time_str = time_system.get_time_string()
         day_str = time_system.get_day_string()
-        time_text = self.font.render(f"{day_str} - {time_str}", True, WHITE)
+        time_text = render_text(self.font, f"{day_str} - {time_str}", True, WHITE)
         surface.blit(time_text, (20, y_offset))
         
     def draw_controls(self, surface, screen_width, screen_height):
@@ -69,19 +112,7 @@ class UI:
         if not self.show_controls:
             return
             
-        controls = [
-            "WASD/Arrows - Move",
-            "Left Click - Use Tool",
-            "Right Click - Claim/Sell",
-            "L - Lock/Unlock Plot",
-            "1-5 - Select Hotbar",
-            "T - Change Tool",
-            "E - Inventory",
-            "C - Crafting Menu",
-            "I - Toggle Grid",
-            "H - Shop Help",
-            "ESC - Save & Quit"
-        ]
+        controls = self.CONTROLS
         
         # Background
         bg_height = len(controls) * 22 + 30
@@ -94,12 +125,12 @@ class UI:
         pygame.draw.rect(surface, WHITE, (screen_width - 230, 10, 220, bg_height), 2)
         
         # Title
-        title = self.title_font.render("Controls", True, WHITE)
+        title = render_text(self.title_font, "Controls", True, WHITE)
         surface.blit(title, (screen_width - 220, 20))
         
         # Controls list
         for i, control in enumerate(controls):
-            text = self.small_font.render(control, True, WHITE)
+            text = render_text(self.small_font, control, True, WHITE)
             surface.blit(text, (screen_width - 220, 50 + i * 22))
     
     def draw_settings_button(self, surface, screen_width, screen_height):
@@ -138,7 +169,7 @@ class UI:
         """Draw temporary notification"""
         if message:
             # Background
-            text_surface = self.font.render(message, True, WHITE)
+            text_surface = render_text(self.font, message, True, WHITE)
             padding = 20
             width = text_surface.get_width() + padding * 2
             height = text_surface.get_height() + padding * 2
@@ -172,11 +203,11 @@ class UI:
         pygame.draw.rect(surface, YELLOW, (menu_x, menu_y, menu_width, menu_height), 3)
         
         # Title
-        title = self.title_font.render("Shop", True, YELLOW)
+        title = render_text(self.title_font, "Shop", True, YELLOW)
         surface.blit(title, (menu_x + 20, menu_y + 10))
         
         # Money display
-        money = self.font.render(f"Your Money: ${player_money}", True, WHITE)
+        money = render_text(self.font, f"Your Money: ${player_money}", True, WHITE)
         surface.blit(money, (menu_x + 20, menu_y + 40))
         
         # Items
@@ -193,16 +224,16 @@ class UI:
             
             # Item name
             name = item.replace("_", " ").title()
-            name_text = self.font.render(name, True, WHITE)
+            name_text = render_text(self.font, name, True, WHITE)
             surface.blit(name_text, (item_rect.x + 10, item_rect.y + 10))
             
             # Price
-            price_text = self.font.render(f"${price}", True, YELLOW if can_buy else GRAY)
+            price_text = render_text(self.font, f"${price}", True, YELLOW if can_buy else GRAY)
             surface.blit(price_text, (item_rect.right - 80, item_rect.y + 10))
             
             y_offset += 50
             
         # Instructions
-        instructions = self.small_font.render("Click item to buy | Right-click to close", 
+        instructions = render_text(self.small_font, "Click item to buy | Right-click to close", 
                                               True, WHITE)
         surface.blit(instructions, (menu_x + 20, menu_y + menu_height - 30))
\ No newline at end of file
@@ -0,0 +1,107 @@
+import pygame
+import math
+
+class Viewport:
+    """Fits the fixed-size world surface (the camera's view) into the resizable window"""
+    
+    def __init__(self, world_width, world_height, screen_width, screen_height):
+        self.world_width = world_width
+        self.world_height = world_height
+        self.scaled_surface = None
+        self.resize(screen_width, screen_height)
+        
+    def resize(self, screen_width, screen_height):
+        """Recompute scale and letterbox - only needed when the window changes size"""
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        
+        scale_x = screen_width / self.world_width
+        scale_y = screen_height / self.world_height
+        self.scale = min(scale_x, scale_y)
+        
+        # Whole-number scales map every world pixel to an exact block of screen pixels
+        self.integer_scale = None
+        if self.scale == int(self.scale):
+            self.integer_scale = int(self.scale)
+            
+        self.scaled_width = int(self.world_width * self.scale)
+        self.scaled_height = int(self.world_height * self.scale)
+        self.offset_x = (screen_width - self.scaled_width) // 2
+        self.offset_y = (screen_height - self.scaled_height) // 2
+        self.rect = pygame.Rect(self.offset_x, self.offset_y, self.scaled_width, self.scaled_height)
+        
+        # Scale into a preallocated surface instead of allocating one per frame
+        if self.integer_scale == 1:
+            self.scaled_surface = None
+        elif (self.scaled_surface is None or
+              self.scaled_surface.get_size() != (self.scaled_width, self.scaled_height)):
+            self.scaled_surface = pygame.Surface((self.scaled_width, self.scaled_height))
+            
+    def screen_to_world(self, screen_pos):
+        """Convert screen position to a position on the world surface"""
+        if self.integer_scale:
+            return ((screen_pos[0] - self.offset_x) // self.integer_scale,
+                    (screen_pos[1] - self.offset_y) // self.integer_scale)
+                    
+        world_x = (screen_pos[0] - self.offset_x) / self.scale
+        world_y = (screen_pos[1] - self.offset_y) / self.scale
+        return (int(world_x), int(world_y))
+        
+    def contains(self, screen_pos):
+        """Check if a screen position is within the world area"""
+        return self.rect.collidepoint(screen_pos)
+        
+    def world_rect_to_screen(self, rect):
+        """Convert a world-surface rect to the screen rect it is scaled onto"""
+        left = self.offset_x + int(rect.left * self.scale)
+        top = self.offset_y + int(rect.top * self.scale)
+        right = self.offset_x + int(rect.right * self.scale)
+        bottom = self.offset_y + int(rect.bottom * self.scale)
+        screen_rect = pygame.Rect(left, top, right - left, bottom - top)
+        
+        # Nearest-neighbour sampling at fractional scales can reach a pixel further
+        if not self.integer_scale:
+            screen_rect = screen_rect.inflate(2, 2).clip(self.rect)
+        return screen_rect
+        
+    def screen_rect_to_world(self, rect):
+        """Convert a screen rect to the world-surface rect covering it"""
+        left = math.floor((rect.left - self.offset_x) / self.scale)
+        top = math.floor((rect.top - self.offset_y) / self.scale)
+        right = math.ceil((rect.right - self.offset_x) / self.scale)
+        bottom = math.ceil((rect.bottom - self.offset_y) / self.scale)
+        
+        # Non-integer scales need a pixel of slack to cover partial pixels
+        if not self.integer_scale:
+            right += 1
+            bottom += 1
+            
+        world_rect = pygame.Rect(left, top, right - left, bottom - top)
+        return world_rect.clip(pygame.Rect(0, 0, self.world_width, self.world_height))
+        
+    def refresh(self, world_surface, areas=None):
+        """Bring the scaled copy of the world up to date (all of it, or just some world-surface areas)"""
+        if self.integer_scale == 1:
+            return  # Blitted straight from the world surface
+            
+        # Fractional scales only sample identically when the whole world is scaled at once
+        if areas is None or not self.integer_scale:
+            pygame.transform.scale(world_surface, self.scaled_surface.get_size(), self.scaled_surface)
+            return
+            
+        for area in areas:
+            local = self.world_rect_to_screen(area).move(-self.offset_x, -self.offset_y)
+            if local.width > 0 and local.height > 0:
+                pygame.transform.scale(world_surface.subsurface(area), local.size,
+                                       self.scaled_surface.subsurface(local))
+                                       
+    def blit(self, screen, world_surface, area=None):
+        """Copy the scaled world (or just a world-surface area of it) onto the screen"""
+        if area is None:
+            area = pygame.Rect(0, 0, self.world_width, self.world_height)
+        dest = self.world_rect_to_screen(area)
+        
+        if self.integer_scale == 1:
+            screen.blit(world_surface, dest, area)
+        else:
+            screen.blit(self.scaled_surface, dest, dest.move(-self.offset_x, -self.offset_y))
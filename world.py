@@ -1,128 +1,302 @@
 import pygame
-from tile import Tile
+from collections import OrderedDict
+from world_chunk import Chunk
+from map_format import load_map, load_object_layer
 from crop import Crop
+from crop_scheduler import CropScheduler
+from crop_engine import CropEngine
+from tile_journal import TileJournal, TileChange
+from pathfinding import Pathfinder
 from settings import *
 import time
 
 class World:
-    def __init__(self):
-        self.tiles = pygame.sprite.Group()
-        self.crops = pygame.sprite.Group()
-        self.tile_map = {}  # Store tiles by grid position
-        self.current_time = time.time()
-        
-    def load(self, filepath):
-        """Load map from file"""
+    def __init__(self, clock=time.time):
+        self.clock = clock  # Where crop growth reads the time from - the headless runner passes in simulated time
+        self.width = MAP_WIDTH  # Map size in tiles
+        self.height = MAP_HEIGHT
+        self.map_data = None  # Packed map read from a map file (None = default layout)
+        self.objects = None  # Object layer, one byte per cell like the map (None = no objects)
+        self.chunks = OrderedDict()  # Loaded chunks by chunk position, least recently used first
+        self.saved_chunks = {}  # Save data of modified chunks that were evicted
+        self.crops = pygame.sprite.Group()  # Crops in loaded chunks
+        # Loaded crops, grown by when they are next due or all at once with numpy
+        if VECTORIZED_CROPS and CropEngine.available:
+            self.crop_schedule = CropEngine()
+        else:
+            self.crop_schedule = CropScheduler()
+        self.journal = TileJournal()  # Every tile edit, for caches, rendering and saves to react to
+        self.journal.subscribe(self.apply_tile_change)
+        self.pathfinder = Pathfinder(self)  # Routes around obstacles, kept up to date through the journal
+        self.current_time = self.clock()
+        
+    def load(self, filepath, objects_path=None):
+        """Load map from a text or binary map file"""
         try:
-            with open(filepath) as f:
-                for y, row in enumerate(f):
-                    for x, tile_type in enumerate(row.strip()):
-                        pos = (x * TILE_SIZE, y * TILE_SIZE)
-                        tile = Tile(pos, tile_type)
-                        self.tiles.add(tile)
-                        self.tile_map[(x, y)] = tile
+            map_data = load_map(filepath, objects_path)
         except FileNotFoundError:
             # Create default map if file doesn't exist
-            self.create_default_map()
+            self.create_default_map(objects_path)
+            return
+        self.reset(map_data.width, map_data.height, map_data)
             
-    def create_default_map(self):
-        """Create a default map layout"""
-        for y in range(MAP_HEIGHT):
-            for x in range(MAP_WIDTH):
-                pos = (x * TILE_SIZE, y * TILE_SIZE)
-                
-                # Create varied terrain
-                if y < 3:  # Top border - trees
-                    tile_type = "T" if x % 3 == 0 else "G"
-                elif x < 2 or x > MAP_WIDTH - 3:  # Side borders
-                    tile_type = "F"
-                elif y > MAP_HEIGHT - 3:  # Bottom - water
-                    tile_type = "W"
-                elif 8 <= x <= 12 and 8 <= y <= 12:  # Center farm area
-                    tile_type = "S"
-                elif x % 4 == 0 and y % 4 == 0:  # Scattered rocks
-                    tile_type = "R"
-                elif (x + y) % 8 == 0:  # Paths
-                    tile_type = "P"
-                else:
-                    tile_type = "G"
-                    
-                tile = Tile(pos, tile_type)
-                self.tiles.add(tile)
-                self.tile_map[(x, y)] = tile
-                
+    def create_default_map(self, objects_path=None):
+        """Create a default map layout, with objects placed from an object layer file if given"""
+        self.reset(MAP_WIDTH, MAP_HEIGHT, objects=load_object_layer(objects_path, MAP_WIDTH, MAP_HEIGHT))
+        
+    def reset(self, width, height, map_data=None, objects=None):
+        """Start a new map - chunks are generated from it as they are needed"""
+        if self.map_data is not None and self.map_data is not map_data:
+            self.map_data.close()
+        self.width = width
+        self.height = height
+        self.map_data = map_data
+        if objects is None and map_data is not None:
+            objects = map_data.objects
+        self.objects = objects
+        self.chunks.clear()
+        self.saved_chunks.clear()
+        self.crops.empty()
+        self.crop_schedule.clear()
+        self.pathfinder.clear()
+        
+    def get_default_tile(self, x, y):
+        """Get the tile character of the default map layout at a grid position"""
+        # Create varied terrain
+        if y < 3:  # Top border - trees
+            return "T" if x % 3 == 0 else "G"
+        elif x < 2 or x > self.width - 3:  # Side borders
+            return "F"
+        elif y > self.height - 3:  # Bottom - water
+            return "W"
+        elif 8 <= x <= 12 and 8 <= y <= 12:  # Center farm area
+            return "S"
+        elif x % 4 == 0 and y % 4 == 0:  # Scattered rocks
+            return "R"
+        elif (x + y) % 8 == 0:  # Paths
+            return "P"
+        return "G"
+        
+    def generate_chunk(self, chunk):
+        """Fill a fresh chunk's tiles from the map"""
+        start_x = chunk.grid_x
+        end_x = min(start_x + CHUNK_SIZE, self.width)
+        for local_y in range(min(CHUNK_SIZE, self.height - chunk.grid_y)):
+            y = chunk.grid_y + local_y
+            if self.map_data is not None:
+                row = self.map_data.get_row(y, start_x, end_x)
+            else:
+                row = "".join(self.get_default_tile(x, y) for x in range(start_x, end_x))
+            chunk.tiles.set_row(local_y, row)
+            
+    def get_chunk(self, chunk_pos):
+        """Get a chunk, loading or generating it if needed (None if off the map)"""
+        chunk = self.chunks.get(chunk_pos)
+        if chunk:
+            self.chunks.move_to_end(chunk_pos)
+            return chunk
+            
+        chunk_x, chunk_y = chunk_pos
+        if not (0 <= chunk_x * CHUNK_SIZE < self.width and 0 <= chunk_y * CHUNK_SIZE < self.height):
+            return None
+            
+        chunk = Chunk(chunk_pos)
+        data = self.saved_chunks.pop(chunk_pos, None)
+        if data:
+            chunk.load_data(data)
+            # Crops kept growing while the chunk was unloaded
+            for crop in chunk.crops.values():
+                crop.catch_up(self.current_time)
+        else:
+            self.generate_chunk(chunk)
+        self.chunks[chunk_pos] = chunk
+        self.crops.add(*chunk.crops.values())
+        for crop in chunk.crops.values():
+            self.crop_schedule.schedule(crop)
+        return chunk
+        
+    def get_chunk_at(self, grid_pos):
+        """Get the chunk holding a grid position"""
+        return self.get_chunk((grid_pos[0] // CHUNK_SIZE, grid_pos[1] // CHUNK_SIZE))
+        
+    def get_chunks_in_area(self, area):
+        """Get the chunks overlapping a pixel area"""
+        chunk_pixels = CHUNK_SIZE * TILE_SIZE
+        chunks = []
+        for chunk_y in range(area.top // chunk_pixels, (area.bottom - 1) // chunk_pixels + 1):
+            for chunk_x in range(area.left // chunk_pixels, (area.right - 1) // chunk_pixels + 1):
+                chunk = self.get_chunk((chunk_x, chunk_y))
+                if chunk:
+                    chunks.append(chunk)
+        return chunks
+        
+    def load_chunks_near(self, area):
+        """Load the chunks around a pixel area and evict far ones beyond the memory budget"""
+        margin = CHUNK_LOAD_MARGIN * CHUNK_SIZE * TILE_SIZE
+        nearby = set(chunk.chunk_pos for chunk in self.get_chunks_in_area(area.inflate(margin * 2, margin * 2)))
+        
+        while len(self.chunks) > CHUNK_CACHE_SIZE:
+            chunk_pos = next(iter(self.chunks))
+            if chunk_pos in nearby:
+                break
+            self.evict_chunk(chunk_pos)
+            
+    def evict_chunk(self, chunk_pos):
+        """Unload a chunk, keeping its save data if it was changed"""
+        chunk = self.chunks.pop(chunk_pos)
+        if chunk.modified:
+            self.saved_chunks[chunk_pos] = chunk.save_data()
+        self.crops.remove(*chunk.crops.values())
+        for crop in chunk.crops.values():
+            self.crop_schedule.remove(crop)
+        
+    def get_kind(self, grid_pos):
+        """Get the tile character at a grid position, or None if there is no tile"""
+        chunk = self.get_chunk_at(grid_pos)
+        return chunk.get_kind(grid_pos) if chunk else None
+        
+    def get_object(self, grid_pos):
+        """Get the object character placed at a grid position, or None"""
+        grid_x, grid_y = grid_pos
+        if self.objects is None or not (0 <= grid_x < self.width and 0 <= grid_y < self.height):
+            return None
+        code = self.objects[grid_y * self.width + grid_x]
+        return chr(code) if code else None
+        
     def get_tile_at_pos(self, pixel_pos):
         """Get tile at pixel position"""
-        grid_x = pixel_pos[0] // TILE_SIZE
-        grid_y = pixel_pos[1] // TILE_SIZE
-        return self.tile_map.get((grid_x, grid_y))
+        grid_pos = (pixel_pos[0] // TILE_SIZE, pixel_pos[1] // TILE_SIZE)
+        chunk = self.get_chunk_at(grid_pos)
+        return chunk.get_tile(grid_pos) if chunk else None
+        
+    def get_crop(self, grid_pos):
+        """Get crop at grid position"""
+        chunk = self.get_chunk_at(grid_pos)
+        return chunk.crops.get(grid_pos) if chunk else None
         
     def get_crop_at_pos(self, pixel_pos):
         """Get crop at pixel position"""
-        for crop in self.crops:
-            if crop.rect.collidepoint(pixel_pos):
-                return crop
-        return None
+        return self.get_crop((pixel_pos[0] // TILE_SIZE, pixel_pos[1] // TILE_SIZE))
+        
+    def get_crops_in_area(self, area):
+        """Get crops on the tiles overlapping a pixel area"""
+        grid_area = pygame.Rect(area.left // TILE_SIZE, area.top // TILE_SIZE, 0, 0)
+        grid_area.width = (area.right - 1) // TILE_SIZE + 1 - grid_area.left
+        grid_area.height = (area.bottom - 1) // TILE_SIZE + 1 - grid_area.top
+        
+        crops = []
+        for chunk in self.get_chunks_in_area(area):
+            for grid_pos, crop in chunk.crops.items():
+                if grid_area.collidepoint(grid_pos):
+                    crops.append(crop)
+        return crops
         
     def till(self, pixel_pos):
         """Till soil at position"""
-        tile = self.get_tile_at_pos(pixel_pos)
-        if tile:
-            return tile.till()
+        grid_pos = (pixel_pos[0] // TILE_SIZE, pixel_pos[1] // TILE_SIZE)
+        chunk = self.get_chunk_at(grid_pos)
+        if chunk:
+            old_cell = chunk.get_cell(grid_pos)
+            if chunk.till(grid_pos):
+                self.record_tile_change(chunk, grid_pos, old_cell)
+                return True
         return False
         
     def water(self, pixel_pos):
         """Water tile at position"""
-        tile = self.get_tile_at_pos(pixel_pos)
-        if tile and tile.water():
-            # Also water any crop on this tile
-            crop = self.get_crop_at_pos(pixel_pos)
-            if crop:
-                crop.water()
-            return True
+        grid_pos = (pixel_pos[0] // TILE_SIZE, pixel_pos[1] // TILE_SIZE)
+        chunk = self.get_chunk_at(grid_pos)
+        if chunk:
+            old_cell = chunk.get_cell(grid_pos)
+            if chunk.water(grid_pos):
+                self.record_tile_change(chunk, grid_pos, old_cell)
+                # Also water any crop on this tile
+                crop = chunk.crops.get(grid_pos)
+                if crop and crop.water():
+                    # Watering speeds growth up, so the next stage comes sooner
+                    self.crop_schedule.schedule(crop)
+                return True
         return False
         
     def plant(self, pixel_pos, crop_type):
         """Plant a seed at position"""
-        grid_x = pixel_pos[0] // TILE_SIZE
-        grid_y = pixel_pos[1] // TILE_SIZE
-        tile = self.tile_map.get((grid_x, grid_y))
+        grid_pos = (pixel_pos[0] // TILE_SIZE, pixel_pos[1] // TILE_SIZE)
+        chunk = self.get_chunk_at(grid_pos)
         
         # Check if tile is farmable and tilled
-        if tile and tile.kind == "S":
+        if chunk and chunk.get_kind(grid_pos) == "S":
             # Check if there's already a crop here
-            tile_pos = (grid_x * TILE_SIZE, grid_y * TILE_SIZE)
-            for crop in self.crops:
-                if crop.rect.topleft == tile_pos:
-                    return False  # Already has a crop
-                    
+            if grid_pos in chunk.crops:
+                return False  # Already has a crop
+                
             # Plant new crop
+            tile_pos = (grid_pos[0] * TILE_SIZE, grid_pos[1] * TILE_SIZE)
             crop = Crop(tile_pos, crop_type)
             crop.time_planted = self.current_time
+            chunk.add_crop(grid_pos, crop)
             self.crops.add(crop)
+            self.crop_schedule.schedule(crop)
             return True
         return False
         
     def harvest(self, pixel_pos):
         """Harvest crop at position"""
-        crop = self.get_crop_at_pos(pixel_pos)
+        grid_pos = (pixel_pos[0] // TILE_SIZE, pixel_pos[1] // TILE_SIZE)
+        crop = self.get_crop(grid_pos)
         if crop and crop.ready_to_harvest:
             value = crop.harvest()
             crop.kill()
+            self.crop_schedule.remove(crop)
+            self.get_chunk_at(grid_pos).remove_crop(grid_pos)
             return crop.crop_type, value
         return None, 0
         
     def update(self):
         """Update world state"""
-        self.current_time = time.time()
+        self.current_time = self.clock()
         
-        # Update all crops
-        for crop in self.crops:
-            crop.update(self.current_time)
+        # Only crops due to change stage are touched
+        self.crop_schedule.update(self.current_time)
             
-    def draw_grid(self, surface):
+    def save_data(self):
+        """Return data for saving - every chunk changed since it was generated"""
+        saved_chunks = dict(self.saved_chunks)
+        for chunk_pos, chunk in self.chunks.items():
+            if chunk.modified:
+                saved_chunks[chunk_pos] = chunk.save_data()
+        return {"chunks": [{"pos": list(chunk_pos), **data} for chunk_pos, data in saved_chunks.items()]}
+        
+    def load_data(self, data):
+        """Load saved data - chunks are restored, and their crops caught up, as they are needed"""
+        self.chunks.clear()
+        self.crops.empty()
+        self.crop_schedule.clear()
+        self.pathfinder.clear()
+        self.current_time = self.clock()
+        self.saved_chunks = {tuple(chunk_data["pos"]): chunk_data for chunk_data in data["chunks"]}
+        
+    def record_tile_change(self, chunk, grid_pos, old_cell):
+        """Publish a tile edit to the journal"""
+        new_cell = chunk.get_cell(grid_pos)
+        self.journal.record(TileChange(grid_pos, chr(old_cell[0]), chr(new_cell[0]), old_cell[1], new_cell[1]))
+        
+    def apply_tile_change(self, change):
+        """Keep the changed chunk's baked terrain and save flag in step with the journal"""
+        chunk = self.chunks.get((change.grid_pos[0] // CHUNK_SIZE, change.grid_pos[1] // CHUNK_SIZE))
+        if chunk:
+            chunk.tile_changed(change.grid_pos)
+        
+    def draw_tiles(self, surface, area=None, offset=(0, 0)):
+        """Draw tiles, optionally only those inside a world-space area, shifted by the camera offset"""
+        if area is None:
+            area = surface.get_rect(topleft=offset)
+        for chunk in self.get_chunks_in_area(area):
+            chunk.draw(surface, area, offset)
+                    
+    def draw_grid(self, surface, offset=(0, 0)):
         """Draw grid lines for debugging"""
-        for x in range(0, SCREEN_WIDTH, TILE_SIZE):
-            pygame.draw.line(surface, (100, 100, 100), (x, 0), (x, SCREEN_HEIGHT), 1)
-        for y in range(0, SCREEN_HEIGHT, TILE_SIZE):
-            pygame.draw.line(surface, (100, 100, 100), (0, y), (SCREEN_WIDTH, y), 1)
\ No newline at end of file
+        width, height = surface.get_size()
+        for x in range(-offset[0] % TILE_SIZE, width, TILE_SIZE):
+            pygame.draw.line(surface, (100, 100, 100), (x, 0), (x, height), 1)
+        for y in range(-offset[1] % TILE_SIZE, height, TILE_SIZE):
+            pygame.draw.line(surface, (100, 100, 100), (0, y), (width, y), 1)
\ No newline at end of file
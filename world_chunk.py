@@ -0,0 +1,90 @@
+import pygame
+from array import array
+from base64 import b64decode, b64encode
+from tile import TileStore
+from crop import Crop
+from terrain_cache import TerrainCache
+from settings import *
+
+class Chunk:
+    """A CHUNK_SIZE x CHUNK_SIZE block of the map with its own tiles, crops and baked terrain"""
+    
+    def __init__(self, chunk_pos):
+        self.chunk_pos = chunk_pos
+        self.grid_x = chunk_pos[0] * CHUNK_SIZE  # Grid position of the top-left tile
+        self.grid_y = chunk_pos[1] * CHUNK_SIZE
+        self.rect = pygame.Rect(self.grid_x * TILE_SIZE, self.grid_y * TILE_SIZE,
+                                CHUNK_SIZE * TILE_SIZE, CHUNK_SIZE * TILE_SIZE)
+        self.tiles = TileStore(CHUNK_SIZE, CHUNK_SIZE)
+        self.crops = {}  # Store crops by grid position
+        self.terrain = None  # Baked terrain layer, built on first draw
+        self.modified = False  # Changed since it was generated - save before evicting
+        
+    def local_pos(self, grid_pos):
+        """Convert a world grid position to a position inside this chunk"""
+        return (grid_pos[0] - self.grid_x, grid_pos[1] - self.grid_y)
+        
+    def get_kind(self, grid_pos):
+        """Get the tile character at a world grid position"""
+        return self.tiles.get_kind(self.local_pos(grid_pos))
+        
+    def get_tile(self, grid_pos):
+        """Get a TileInfo for a world grid position"""
+        return self.tiles.get_tile(self.local_pos(grid_pos))
+        
+    def get_cell(self, grid_pos):
+        """Get the raw (kind code, flags) bytes at a world grid position"""
+        return self.tiles.get_cell(self.local_pos(grid_pos))
+        
+    def till(self, grid_pos):
+        """Till soil at a world grid position"""
+        return self.tiles.till(self.local_pos(grid_pos))
+        
+    def water(self, grid_pos):
+        """Water the tile at a world grid position"""
+        return self.tiles.water(self.local_pos(grid_pos))
+        
+    def tile_changed(self, grid_pos):
+        """Mark the chunk modified and patch its baked terrain"""
+        self.modified = True
+        if self.terrain:
+            self.terrain.update_tile(self.local_pos(grid_pos))
+            
+    def add_crop(self, grid_pos, crop):
+        """Place a crop in this chunk"""
+        self.crops[grid_pos] = crop
+        self.modified = True
+        
+    def remove_crop(self, grid_pos):
+        """Take a crop out of this chunk"""
+        del self.crops[grid_pos]
+        self.modified = True
+        
+    def save_data(self):
+        """Return data for saving"""
+        return {
+            "kinds": b64encode(self.tiles.kinds.tobytes()).decode("ascii"),
+            "flags": b64encode(self.tiles.flags.tobytes()).decode("ascii"),
+            "crops": [crop.save_data() for crop in self.crops.values()]
+        }
+        
+    def load_data(self, data):
+        """Load saved data"""
+        self.tiles.kinds = array("B", b64decode(data["kinds"]))
+        self.tiles.flags = array("B", b64decode(data["flags"]))
+        for crop_data in data["crops"]:
+            crop = Crop(tuple(crop_data["pos"]), crop_data["crop_type"])
+            crop.load_data(crop_data)
+            self.crops[(crop.rect.x // TILE_SIZE, crop.rect.y // TILE_SIZE)] = crop
+        self.modified = True
+        
+    def bake(self):
+        """Composite the chunk's terrain ahead of drawing it"""
+        if self.terrain is None:
+            self.terrain = TerrainCache(self.tiles)
+            
+    def draw(self, surface, area, offset=(0, 0)):
+        """Draw the part of this chunk's terrain inside a world-space area"""
+        self.bake()
+        local_area = area.clip(self.rect).move(-self.rect.x, -self.rect.y)
+        self.terrain.draw(surface, local_area, (offset[0] - self.rect.x, offset[1] - self.rect.y))